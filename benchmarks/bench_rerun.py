@@ -0,0 +1,192 @@
+"""Benchmark de execução completa do `dashboard_proposta.py` sem navegador.
+
+Gera propostas sintéticas de tamanhos configuráveis, executa o app com
+`streamlit.testing.v1.AppTest` e grava um JSON com tempo de execução (fria,
+com os caches vazios, e quente), pico de memória e número de elementos
+emitidos por seção. O JSON tem chaves ordenadas para ser comparado com `diff`
+entre versões.
+
+Uso:
+    python benchmarks/bench_rerun.py
+    python benchmarks/bench_rerun.py --cenario 1000 20 20000 --repeticoes 5 --saida bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.testing.v1.element_tree import Block  # noqa: E402
+
+import proposta_dados  # noqa: E402
+
+APP = os.path.join(RAIZ, "dashboard_proposta.py")
+
+# (empresas, pessoas, tarefas)
+CENARIOS_PADRAO = [
+    (10, 4, 200),
+    (100, 10, 2_000),
+    (1_000, 20, 20_000),
+    (10_000, 50, 100_000),
+]
+
+VERBOS = ["Implementar", "Integrar", "Validar", "Automatizar", "Analisar", "Revisar", "Monitorar", "Otimizar"]
+OBJETOS = ["funil de vendas", "chatbot de atendimento", "integração com WhatsApp", "painel de KPIs",
+           "pipeline de dados", "site institucional", "API de pedidos", "relatórios de desempenho"]
+
+
+def gerar_companies(n_empresas, n_pessoas, n_tarefas, semente=0):
+    """Gera um dict no formato de `companies` com as tarefas distribuídas ao
+    acaso entre empresas, pessoas e sprints 1 a 8."""
+    aleatorio = random.Random(semente)
+    pessoas = [f"Pessoa {i + 1:02d}" for i in range(n_pessoas)]
+    companies = {}
+    for i in range(n_empresas):
+        equipe = aleatorio.sample(pessoas, min(n_pessoas, aleatorio.randint(2, 6)))
+        companies[f"Empresa {i + 1:05d}"] = {
+            "description": f"Cliente sintético {i + 1}.",
+            "objective": f"{aleatorio.choice(VERBOS)} {aleatorio.choice(OBJETOS)}.",
+            "sprints": {pessoa: [] for pessoa in equipe},
+        }
+    nomes = list(companies)
+    for _ in range(n_tarefas):
+        sprints = companies[aleatorio.choice(nomes)]["sprints"]
+        sprints[aleatorio.choice(list(sprints))].append({
+            "sprint": aleatorio.randint(1, 8),
+            "task": f"{aleatorio.choice(VERBOS)} {aleatorio.choice(OBJETOS)}",
+            "hours": aleatorio.choice([5, 8, 10, 12, 15, 20]),
+        })
+    return companies
+
+
+def escrever_proposta(diretorio, companies):
+    """Grava a proposta sintética, reaproveitando roadmap e ferramentas de `dados/`."""
+    for nome in ("roadmap.json", "ferramentas.csv"):
+        shutil.copy(os.path.join(RAIZ, "dados", nome), diretorio)
+    with open(os.path.join(diretorio, "companies.json"), "w", encoding="utf-8") as arquivo:
+        json.dump(companies, arquivo, ensure_ascii=False)
+
+
+def _contar(no):
+    if isinstance(no, Block):
+        return 1 + sum(_contar(filho) for filho in no.children.values())
+    return 1
+
+
+def elementos_por_secao(at):
+    """Conta os elementos emitidos entre cada separador `---` da página,
+    nomeando a seção pelo primeiro título ou subtítulo dela."""
+    secoes = {}
+    nome, contagem = None, 0
+    for no in at.main.children.values():
+        if no.type == "markdown" and no.value == "---":
+            secoes[nome or f"seção {len(secoes) + 1}"] = contagem + 1
+            nome, contagem = None, 0
+            continue
+        if nome is None and no.type in ("title", "subheader"):
+            nome = no.value
+        contagem += _contar(no)
+    if contagem:
+        secoes[nome or f"seção {len(secoes) + 1}"] = contagem
+    secoes["(sidebar)"] = sum(_contar(no) for no in at.sidebar.children.values())
+    return secoes
+
+
+def executar(timeout):
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    inicio = time.perf_counter()
+    at.run()
+    duracao = time.perf_counter() - inicio
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return at, duracao
+
+
+def executar_com_memoria(timeout):
+    tracemalloc.start()
+    try:
+        at, _ = executar(timeout)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return at, pico / 2**20
+
+
+def medir_cenario(n_empresas, n_pessoas, n_tarefas, repeticoes, timeout):
+    with tempfile.TemporaryDirectory() as diretorio:
+        inicio = time.perf_counter()
+        escrever_proposta(diretorio, gerar_companies(n_empresas, n_pessoas, n_tarefas))
+        geracao = time.perf_counter() - inicio
+        proposta_dados.DIRETORIO_PADRAO = diretorio
+
+        st.cache_resource.clear()
+        _, fria = executar(timeout)
+        quentes = [executar(timeout)[1] for _ in range(repeticoes)]
+
+        st.cache_resource.clear()
+        _, pico_frio = executar_com_memoria(timeout)
+        at, pico_quente = executar_com_memoria(timeout)
+
+    elementos = elementos_por_secao(at)
+    return {
+        "empresas": n_empresas,
+        "pessoas": n_pessoas,
+        "tarefas": n_tarefas,
+        "geracao_s": round(geracao, 4),
+        "execucao_fria_s": round(fria, 4),
+        "execucao_quente_s": {
+            "min": round(min(quentes), 4),
+            "mediana": round(statistics.median(quentes), 4),
+            "max": round(max(quentes), 4),
+        },
+        "pico_memoria_mb": {"fria": round(pico_frio, 2), "quente": round(pico_quente, 2)},
+        "elementos_por_secao": elementos,
+        "elementos_total": sum(elementos.values()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--cenario", nargs=3, type=int, action="append", metavar=("EMPRESAS", "PESSOAS", "TAREFAS"),
+        help="tamanho da proposta sintética (pode ser repetido); padrão: 10 a 10.000 empresas",
+    )
+    parser.add_argument("--repeticoes", type=int, default=3, help="execuções quentes por cenário")
+    parser.add_argument("--timeout", type=float, default=600, help="tempo máximo por execução (s)")
+    parser.add_argument("--saida", default="bench_rerun.json", help="arquivo JSON de saída")
+    args = parser.parse_args(argv)
+
+    diretorio_original = proposta_dados.DIRETORIO_PADRAO
+    resultados = []
+    try:
+        for n_empresas, n_pessoas, n_tarefas in args.cenario or CENARIOS_PADRAO:
+            print(f"{n_empresas} empresas, {n_pessoas} pessoas, {n_tarefas} tarefas...", file=sys.stderr)
+            resultados.append(medir_cenario(n_empresas, n_pessoas, n_tarefas, args.repeticoes, args.timeout))
+    finally:
+        proposta_dados.DIRETORIO_PADRAO = diretorio_original
+
+    relatorio = {
+        "python": platform.python_version(),
+        "streamlit": st.__version__,
+        "repeticoes": args.repeticoes,
+        "cenarios": resultados,
+    }
+    with open(args.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2, sort_keys=True)
+        arquivo.write("\n")
+    print(f"Resultados gravados em {args.saida}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
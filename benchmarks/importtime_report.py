@@ -0,0 +1,126 @@
+"""Relatório de tempo de importação na partida a frio do app.
+
+Executa, num processo Python novo com `-X importtime`, as importações feitas
+no topo de `dashboard_proposta.py` (ou o script inteiro, com `--script`, que
+inclui os imports feitos sob demanda pelas seções) e resume o resultado: tempo
+total de importação, tempo por pacote de primeiro nível e os módulos mais
+lentos.
+
+Uso:
+    python benchmarks/importtime_report.py
+    python benchmarks/importtime_report.py --script --json importtime.json
+    python benchmarks/importtime_report.py --limite-ms 1500   # falha se passar do limite
+"""
+import argparse
+import ast
+import collections
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "dashboard_proposta.py")
+
+LINHA = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def imports_do_topo(caminho=APP):
+    """Comandos `import` do nível de módulo do script, até a primeira chamada."""
+    with open(caminho, encoding="utf-8") as arquivo:
+        arvore = ast.parse(arquivo.read())
+    comandos = []
+    for no in arvore.body:
+        if isinstance(no, ast.Expr) and isinstance(no.value, ast.Call):
+            break
+        if isinstance(no, (ast.Import, ast.ImportFrom)):
+            comandos.append(ast.unparse(no))
+    return comandos
+
+
+def medir(script=False):
+    """Roda o processo filho e devolve (linhas do -X importtime, tempo total em s)."""
+    if script:
+        codigo = f"import runpy; runpy.run_path({APP!r}, run_name='__main__')"
+    else:
+        codigo = "; ".join(imports_do_topo())
+    inicio = time.perf_counter()
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=RAIZ, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": RAIZ},
+    )
+    duracao = time.perf_counter() - inicio
+    if processo.returncode != 0:
+        sys.stderr.write(processo.stderr)
+        raise SystemExit(processo.returncode)
+    linhas = []
+    for linha in processo.stderr.splitlines():
+        encontrada = LINHA.match(linha)
+        if encontrada:
+            proprio, acumulado, recuo, modulo = encontrada.groups()
+            linhas.append((modulo, int(proprio), int(acumulado), len(recuo) // 2))
+    return linhas, duracao
+
+
+def resumir(linhas, duracao, limite=15):
+    por_pacote = collections.Counter()
+    for modulo, proprio, _, _ in linhas:
+        por_pacote[modulo.split(".")[0]] += proprio
+    # Só os módulos importados diretamente (nível 0) somam o total sem contar
+    # duas vezes os que eles importam.
+    total_us = sum(acumulado for _, _, acumulado, nivel in linhas if nivel == 0)
+    mais_lentos = sorted(linhas, key=lambda linha: linha[2], reverse=True)[:limite]
+    return {
+        "processo_ms": round(duracao * 1000, 1),
+        "importacao_total_ms": round(total_us / 1000, 1),
+        "modulos": len(linhas),
+        "por_pacote_ms": {
+            pacote: round(us / 1000, 1) for pacote, us in por_pacote.most_common(limite)
+        },
+        "mais_lentos_ms": [
+            {"modulo": modulo, "acumulado": round(acumulado / 1000, 1), "proprio": round(proprio / 1000, 1)}
+            for modulo, proprio, acumulado, _ in mais_lentos
+        ],
+    }
+
+
+def imprimir(resumo):
+    print(f"Processo: {resumo['processo_ms']:.0f} ms | importações: {resumo['importacao_total_ms']:.0f} ms "
+          f"({resumo['modulos']} módulos)")
+    print("\nPor pacote (tempo próprio):")
+    for pacote, ms in resumo["por_pacote_ms"].items():
+        print(f"  {ms:9.1f} ms  {pacote}")
+    print("\nMódulos mais lentos (acumulado):")
+    for item in resumo["mais_lentos_ms"]:
+        print(f"  {item['acumulado']:9.1f} ms  {item['modulo']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", action="store_true",
+                        help="executa o script inteiro (modo bare), e não só os imports do topo")
+    parser.add_argument("--repeticoes", type=int, default=3,
+                        help="execuções do processo; vale a de menor tempo de importação")
+    parser.add_argument("--json", metavar="ARQUIVO", help="grava o resumo em JSON")
+    parser.add_argument("--limite-ms", type=float,
+                        help="termina com erro se o tempo total de importação passar deste valor")
+    args = parser.parse_args(argv)
+
+    resumos = [resumir(*medir(args.script)) for _ in range(args.repeticoes)]
+    resumo = min(resumos, key=lambda r: r["importacao_total_ms"])
+    imprimir(resumo)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resumo, arquivo, ensure_ascii=False, indent=2)
+            arquivo.write("\n")
+    if args.limite_ms is not None and resumo["importacao_total_ms"] > args.limite_ms:
+        print(f"\nTempo de importação acima do limite de {args.limite_ms:.0f} ms.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,425 +1,737 @@
 import streamlit as st
-import altair as alt
 import pandas as pd
-import numpy as np
-import plotly.graph_objs as go
-import plotly.express as px
-import datetime
-
-# Verifica se o Graphviz está instalado
-try:
-    import graphviz
-    graphviz_installed = True
-except ImportError:
-    graphviz_installed = False
+import math
+import os
+import threading
+import time
+
+import proposta_analise
+import proposta_busca
+import proposta_cache
+import proposta_conteudo
+import proposta_custos
+import proposta_dados
+import proposta_gantt
+import proposta_observador
+import proposta_perf
+
+# Bibliotecas pesadas (altair, plotly, graphviz) são importadas só na seção que as usa,
+# para não pesar no tempo até a primeira renderização. Ver
+# benchmarks/importtime_report.py.
 
 # =============================================================================
 # 1. CONFIGURAÇÃO DA PÁGINA
 # =============================================================================
+inicio_execucao = time.perf_counter()
 st.set_page_config(
     page_title="Proposta de Transformação Digital - Scrum",
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
+# -----------------------------------------------------------------------------
+# Dados da proposta (arquivos em `dados/` ou num catálogo, ver proposta_dados.py)
+# -----------------------------------------------------------------------------
+# Cada grupo de arquivos é relido só quando sua assinatura (caminho, mtime e
+# tamanho) muda; nos demais reruns o conteúdo interpretado vem do cache. Os
+# dados de todas as propostas e as tabelas derivadas deles ficam num único
+# cache LRU do processo, compartilhado entre sessões e limitado em bytes
+# (PROPOSTA_CACHE_MB); qualquer entrada pode ser descartada e reconstruída a
+# partir dos arquivos, então os objetos em cache não devem ser modificados.
+# A exceção é o `ProgressoRoadmap` de uma proposta com status alterados no
+# app, que sai desse cache enquanto guarda as edições (ver `fixar_progresso`).
+@st.cache_resource
+def cache_propostas():
+    return proposta_cache.CacheLRU(int(float(os.environ.get("PROPOSTA_CACHE_MB", "256")) * 2**20))
+
+
+memorizar = cache_propostas().memorizar
+
+
+def fonte_versionada(grupo):
+    """Caminhos do grupo de arquivos da proposta selecionada e a assinatura
+    que versiona o cache."""
+    caminhos = proposta_dados.localizar_fontes(diretorio_proposta)[grupo]
+    return proposta_dados.assinatura(caminhos), caminhos
+
+
+@memorizar
+def carregar_roadmap(versao, caminhos):
+    return proposta_dados.ler_roadmap(caminhos)
+
+
+@memorizar
+def carregar_tabelas(versao, caminhos):
+    """`(empresas, tarefas)` colunares; ver `proposta_dados.tabelas_de_companies`."""
+    return proposta_dados.ler_tabelas(caminhos)
+
+
+@memorizar
+def carregar_ferramentas(versao, caminhos):
+    return proposta_dados.ler_ferramentas(caminhos)
+
+
+@memorizar
+def carregar_cotacoes(versao, caminhos):
+    return proposta_dados.ler_cotacoes(caminhos)
+
+
+@memorizar
+def construir_progresso(versao, sprints_meses, _tarefas):
+    """Totais de horas planejadas e concluídas por mês e por empresa, somados
+    uma vez por versão dos dados."""
+    return proposta_analise.ProgressoRoadmap(_tarefas, sprints_meses)
+
+
+@st.cache_resource
+def progressos_editados():
+    """Diretório -> ((versão, sprints dos meses), ProgressoRoadmap) das
+    propostas com status alterados no app, e o lock que protege o dict."""
+    return {}, threading.Lock()
+
+
+def carregar_progresso(versao, sprints_meses, tarefas):
+    """Progresso da proposta selecionada: o fixado com as edições de status,
+    se houver para esta versão, ou o do cache LRU."""
+    progressos, lock = progressos_editados()
+    with lock:
+        chave, progresso = progressos.get(diretorio_proposta, (None, None))
+        if chave == (versao, sprints_meses):
+            return progresso
+        # Os arquivos de tarefas mudaram: as edições da versão anterior caem.
+        progressos.pop(diretorio_proposta, None)
+    return construir_progresso(versao, sprints_meses, tarefas)
+
+
+def fixar_progresso(versao, sprints_meses, progresso):
+    """Tira `progresso` do alcance do LRU antes da primeira mudança de status,
+    para as edições não se perderem num despejo; fica fixado até a versão dos
+    arquivos de tarefas mudar. Se outra sessão já fixou um progresso desta
+    versão, é ele que vale e é devolvido."""
+    progressos, lock = progressos_editados()
+    with lock:
+        chave, fixado = progressos.get(diretorio_proposta, (None, None))
+        if chave != (versao, sprints_meses):
+            progressos[diretorio_proposta] = ((versao, sprints_meses), progresso)
+            fixado = progresso
+    return fixado
+
+
+def invalidar_dados():
+    """Descarta os dados em cache; a próxima execução relê todos os arquivos.
+    Os status editados no app continuam valendo enquanto os arquivos de
+    tarefas não mudarem."""
+    cache_propostas().limpar()
+
+
+@st.cache_resource
+def registro_desempenho():
+    """Medições por seção das execuções mais recentes, de todas as sessões."""
+    return proposta_perf.RegistroDesempenho()
+
+
+# A proposta vem do parâmetro `?proposta=` da URL ou do seletor da barra
+# lateral, que mantém a URL atualizada para o link poder ser compartilhado.
+propostas = proposta_dados.listar_propostas(proposta_dados.DIRETORIO_CATALOGO)
+nomes_propostas = list(propostas)
+if st.session_state.get("proposta") not in propostas:
+    pedida = st.query_params.get("proposta")
+    st.session_state["proposta"] = pedida if pedida in propostas else nomes_propostas[0]
+
+# A medição fica ligada com o painel aberto ou com PROPOSTA_PERF definido (por
+# exemplo, para alimentar PROPOSTA_PERF_LOG); desligada, as marcas de seção
+# abaixo não fazem nada. O cronômetro começa antes da barra lateral para
+# contar os elementos dela; o estado do painel vem da sessão, que já tem o
+# valor do toggle antes de ele ser desenhado.
+proposta_perf.remover_contador()
+if st.session_state.get("painel_desempenho") or os.environ.get("PROPOSTA_PERF"):
+    cronometro = proposta_perf.Cronometro(
+        registro_desempenho(),
+        "1. Configuração da página",
+        inicio=inicio_execucao,
+        arquivo_log=os.environ.get("PROPOSTA_PERF_LOG"),
+    )
+else:
+    cronometro = proposta_perf.CRONOMETRO_INATIVO
+
+with st.sidebar:
+    if len(nomes_propostas) > 1:
+        nome_proposta = st.selectbox("Proposta", nomes_propostas, key="proposta")
+        st.query_params["proposta"] = nome_proposta
+    else:
+        nome_proposta = nomes_propostas[0]
+    if st.button("Recarregar dados"):
+        invalidar_dados()
+    ao_vivo = st.toggle("Atualização ao vivo", key="ao_vivo")
+    painel_desempenho = st.toggle("Painel de desempenho", key="painel_desempenho")
+
+diretorio_proposta = propostas[nome_proposta]
+
 # =============================================================================
 # 2. CSS CUSTOMIZADO
 # =============================================================================
-custom_css = """
-<style>
-body {
-    font-family: 'Roboto', sans-serif;
-    background-color: #f4f4f8;
-    color: #000000 !important;
-    margin: 0;
-    padding: 0;
-}
-.block-container {
-    background-color: #fff;
-    border-radius: 12px;
-    padding: 2rem 3rem;
-    margin-bottom: 2rem;
-    box-shadow: 0 4px 8px rgba(0,0,0,0.05);
-}
-h1, h2, h3 {
-    color: #283c63;
-}
-h1 {
-    font-size: 2.5rem;
-}
-h2 {
-    font-size: 2rem;
-}
-.stExpander {
-    border: 1px solid #ddd;
-    border-radius: 8px;
-    margin-bottom: 1rem;
-}
-.stProgress > div > div > div > div {
-    background-image: linear-gradient(to right, #4facfe, #00f2fe);
-}
-.sprint-task {
-    background-color: #e9ecef;
-    padding: 0.75rem;
-    border-radius: 6px;
-    margin-bottom: 0.5rem;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-}
-.goal-target {
-    background-color: #f9f9f9;
-    padding: 0.75rem;
-    border-radius: 6px;
-    margin-bottom: 0.5rem;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-}
-.streamlit-expanderHeader {
-    font-size: 1.2rem;
-    color: #3366cc;
-    font-weight: bold;
-}
-.highlight {
-    font-weight: bold;
-    color: #007bff;
-}
-.company-container {
-    border: 1px solid #ddd;
-    border-radius: 8px;
-    padding: 1rem;
-    margin-bottom: 1rem;
-    background-color: #f9f9f9;
-}
-.sprint-details {
-    margin-top: 1rem;
-    padding: 0.5rem;
-    border: 1px solid #eee;
-    border-radius: 4px;
-}
-</style>
-"""
-st.markdown(custom_css, unsafe_allow_html=True)
+cronometro.secao("2. CSS customizado")
+st.markdown(proposta_conteudo.CUSTOM_CSS, unsafe_allow_html=True)
 
 # =============================================================================
 # 3. CABEÇALHO
 # =============================================================================
-st.title("Proposta de Transformação Digital - Scrum")
-st.subheader("Estratégias Personalizadas para Crescimento Acelerado")
-st.caption("Liderança: Alberth (Head de Dados, Tecnologia e Marketing com IA)")
-st.caption("Product Owner: Ricardo Menendez Sarmento")
+cronometro.secao("3. Cabeçalho")
+st.title(proposta_conteudo.TITULO)
+st.subheader(proposta_conteudo.SUBTITULO)
+for legenda in proposta_conteudo.LEGENDAS:
+    st.caption(legenda)
 st.write("---")
 
 # =============================================================================
 # 4. VISÃO GERAL DO PROJETO
 # =============================================================================
-st.subheader("Visão Geral Estratégica (4 Meses)")
-st.write("""
-Este projeto visa integrar automações, desenvolver sistemas customizados e aplicar análises de dados avançadas para aprimorar o desempenho organizacional.  
-Sob a liderança de **Alberth** e com o gerenciamento do backlog por **Ricardo**, adotaremos a metodologia **Scrum** para garantir entregas de alto valor em sprints de 2 semanas.  
-Cada ciclo contará com Daily Stand-ups, Sprint Reviews e Retrospectivas, assegurando melhoria contínua e adaptação às necessidades dos *stakeholders*.
-""")
+cronometro.secao("4. Visão geral")
+# A duração da proposta é o número de meses do roadmap.
+roadmap_data = carregar_roadmap(*fonte_versionada("roadmap"))
+st.subheader(f"Visão Geral Estratégica ({len(roadmap_data)} Meses)")
+st.write(proposta_conteudo.VISAO_GERAL)
 st.write("---")
 
 # =============================================================================
 # 5. ROADMAP DE IMPLEMENTAÇÃO
 # =============================================================================
+cronometro.secao("5. Roadmap")
 st.subheader("Roadmap de Implementação")
-roadmap_data = {
-    "Mês 1": {"progresso": 30, "objetivo": "Definição do Escopo e Planejamento Inicial", 
-              "meta": "Escopo detalhado e backlog priorizado.", 
-              "descricao": "Estabelecimento das bases do projeto com reuniões iniciais e definição das prioridades."},
-    "Mês 2": {"progresso": 55, "objetivo": "Desenvolvimento e Implementação Base", 
-              "meta": "Protótipos funcionais e integração inicial.", 
-              "descricao": "Desenvolvimento dos primeiros módulos e integração das soluções básicas."},
-    "Mês 3": {"progresso": 80, "objetivo": "Otimização e Testes", 
-              "meta": "Sistemas otimizados e testes validados.", 
-              "descricao": "Execução de testes rigorosos e ajustes para garantir alta performance."},
-    "Mês 4": {"progresso": 100, "objetivo": "Implantação e Melhorias Contínuas", 
-              "meta": "Deploy final com monitoramento e ajustes pós-implementação.", 
-              "descricao": "Lançamento das soluções e monitoramento contínuo para aperfeiçoamento."}
-}
-cols = st.columns(4)
-for i, mes in enumerate(roadmap_data.keys()):
-    with cols[i]:
-        st.write(f"**{mes}**")
-        st.progress(roadmap_data[mes]["progresso"] / 100)
-        with st.expander(f"Detalhes de {mes}"):
-            st.markdown(f"""
-            <div class="goal-target">
-                <strong>Objetivo:</strong> {roadmap_data[mes]["objetivo"]}
-            </div>
-            <div class="goal-target">
-                <strong>Meta:</strong> {roadmap_data[mes]["meta"]}
-            </div>
-            <p>{roadmap_data[mes]["descricao"]}</p>
-            """, unsafe_allow_html=True)
+# As tarefas também alimentam o progresso do roadmap: cada mês cobre as
+# sprints listadas nele (ver `proposta_analise.sprints_dos_meses`) e seu
+# progresso é a fração das horas planejadas já concluídas.
+sprints_meses = proposta_analise.sprints_dos_meses(roadmap_data)
+versao_tarefas, caminhos_tarefas = fonte_versionada("tarefas")
+empresas_df, tarefas_df = carregar_tabelas(versao_tarefas, caminhos_tarefas)
+chave_progresso = (versao_tarefas, tuple(sprints_meses.values()))
+progresso = carregar_progresso(*chave_progresso, tarefas_df)
+
+
+# Fragmento: interações dentro do roadmap reexecutam só este bloco.
+@st.fragment
+def renderizar_roadmap(roadmap_data, progresso):
+    concluidas, planejadas = progresso.totais_meses()
+    cols = st.columns(len(roadmap_data))
+    for i, mes in enumerate(roadmap_data.keys()):
+        with cols[i]:
+            st.write(f"**{mes}**")
+            if planejadas[i] > 0:
+                st.progress(
+                    min(concluidas[i] / planejadas[i], 1.0),
+                    text=f"{concluidas[i] / planejadas[i]:.0%} · {concluidas[i]:g} de {planejadas[i]:g} horas",
+                )
+            else:
+                st.progress(0.0, text="Sem horas planejadas")
+            with st.expander(f"Detalhes de {mes}"):
+                st.markdown(proposta_conteudo.html_detalhes_mes(roadmap_data[mes]), unsafe_allow_html=True)
+
+
+renderizar_roadmap(roadmap_data, progresso)
 st.write("---")
 
 # =============================================================================
 # 6. PROJETOS E SPRINTS DEDICADAS
 # =============================================================================
+cronometro.secao("6. Projetos e sprints")
 st.subheader("Projetos e Sprints Dedicadas")
-companies = {
-    "Fênix Telecom": {
-        "description": "Soluções tecnológicas para automação.",
-        "objective": "Integração de API, funil de vendas e automação de pedidos.",
-        "sprints": {
-            "Keilon": [
-                {"sprint": 1, "task": "Criar endpoints de API para integração com sistemas legados", "hours": 20},
-                {"sprint": 2, "task": "Garantir a segurança e escalabilidade das integrações", "hours": 15},
-                {"sprint": 3, "task": "Realizar testes de carga e estresse", "hours": 20},
-                {"sprint": 4, "task": "Implementar funil de vendas e automação de pedidos", "hours": 20}
-            ],
-            "Thiago": [
-                {"sprint": 1, "task": "Análise de dados para otimização do funil", "hours": 15},
-                {"sprint": 2, "task": "Implementação de painéis de monitoramento", "hours": 20},
-                {"sprint": 3, "task": "Automação de relatórios de desempenho", "hours": 15}
-            ],
-            "Ricardo": [
-                {"sprint": 1, "task": "Definir prioridades do backlog e alinhar requisitos", "hours": 10},
-                {"sprint": 2, "task": "Revisar protótipos e validar entregas iniciais", "hours": 8}
-            ],
-            "Alberth": [
-                {"sprint": 1, "task": "Estabelecer estratégia de integração e supervisão do projeto", "hours": 12},
-                {"sprint": 3, "task": "Avaliar performance das integrações e ajustar roadmap estratégico", "hours": 10}
-            ]
-        },
-    },
-    "Chalés Recanto da Paz": {
-        "description": "Insights de dados para decisões estratégicas.",
-        "objective": "Pipelines de automação, relatórios avançados e funil de vendas PWA.",
-        "sprints": {
-            "Keilon": [
-                {"sprint": 1, "task": "Desenvolver funil de vendas em PWA", "hours": 20},
-                {"sprint": 2, "task": "Otimizar a experiência do usuário nas reservas", "hours": 15},
-                {"sprint": 3, "task": "Integrar sistema de pagamento no PWA", "hours": 20}
-            ],
-            "Thiago": [
-                {"sprint": 1, "task": "Coletar e estruturar dados para análise", "hours": 15},
-                {"sprint": 2, "task": "Criar pipelines de automação no Maker.com", "hours": 20},
-                {"sprint": 3, "task": "Gerar relatórios dinâmicos com métricas-chave", "hours": 15},
-                {"sprint": 4, "task": "Análise preditiva de ocupação", "hours": 10}
-            ],
-            "Ricardo": [
-                {"sprint": 1, "task": "Priorizar funil de vendas e requisitos para PWA", "hours": 10},
-                {"sprint": 3, "task": "Validar relatórios e KPIs com feedback dos stakeholders", "hours": 8}
-            ],
-            "Alberth": [
-                {"sprint": 1, "task": "Definir estratégia de insights e supervisão do pipeline", "hours": 12},
-                {"sprint": 2, "task": "Monitorar implementação dos painéis e KPIs estratégicos", "hours": 10}
-            ]
-        },
-    },
-    "AGX Capital": {
-        "description": "Agência de design especializada em visuais.",
-        "objective": "Geração automatizada de arte e site com IA.",
-        "sprints": {
-            "Keilon": [
-                {"sprint": 1, "task": "Desenvolver templates dinâmicos para artes", "hours": 20},
-                {"sprint": 2, "task": "Integrar templates com ferramentas de design", "hours": 15},
-                {"sprint": 3, "task": "Desenvolver site institucional e IA de atendimento", "hours": 20}
-            ],
-            "Thiago": [
-                {"sprint": 1, "task": "Criar pipelines para alimentar templates com dados", "hours": 15},
-                {"sprint": 2, "task": "Garantir alinhamento com diretrizes de branding", "hours": 20},
-                {"sprint": 3, "task": "Implementar automação avançada no site", "hours": 15},
-                {"sprint": 4, "task": "Realizar testes A/B para otimização de conversão", "hours": 10}
-            ],
-            "Ricardo": [
-                {"sprint": 1, "task": "Revisar requisitos para templates e site institucional", "hours": 10},
-                {"sprint": 3, "task": "Validar funcionalidades e performance da IA", "hours": 8}
-            ],
-            "Alberth": [
-                {"sprint": 1, "task": "Supervisionar integração de ferramentas de design", "hours": 12},
-                {"sprint": 2, "task": "Acompanhar implantação de automação avançada e estratégia de marca", "hours": 10}
-            ]
-        },
-    },
-    "Brprix Transportes": {
-        "description": "Solução de transporte e logística.",
-        "objective": "Monitoramento de motoristas e funil de vendas automatizado.",
-        "sprints": {
-            "Keilon": [
-                {"sprint": 1, "task": "Implementar sistema de monitoramento GPS", "hours": 20},
-                {"sprint": 2, "task": "Integrar WhatsApp para automação de vendas", "hours": 15},
-                {"sprint": 3, "task": "Desenvolver sistema de alertas", "hours": 20}
-            ],
-            "Thiago": [
-                {"sprint": 1, "task": "Configurar infraestrutura de dados", "hours": 15},
-                {"sprint": 2, "task": "Analisar rotas para otimização de custos", "hours": 20},
-                {"sprint": 3, "task": "Criar painel de controle para gestão da frota", "hours": 15},
-                {"sprint": 4, "task": "Implementar sistema de segurança com alertas preditivos", "hours": 10}
-            ],
-            "Ricardo": [
-                {"sprint": 1, "task": "Priorizar funcionalidades do sistema de monitoramento", "hours": 10},
-                {"sprint": 3, "task": "Validar integração do WhatsApp com funil de vendas", "hours": 8}
-            ],
-            "Alberth": [
-                {"sprint": 1, "task": "Definir estratégia de monitoramento e campanhas de tráfego", "hours": 12},
-                {"sprint": 2, "task": "Supervisionar análise de rotas e otimização logística", "hours": 10}
-            ]
-        },
-    },
-    "DHE Componentes Hidráulicos": {
-        "description": "Componentes hidráulicos e serviços.",
-        "objective": "Site de vendas de serviços e funil de vendas automatizado.",
-        "sprints": {
-            "Keilon": [
-                {"sprint": 1, "task": "Arquitetura do site de serviços", "hours": 20},
-                {"sprint": 2, "task": "Design do formulário de captura de leads", "hours": 15},
-                {"sprint": 3, "task": "Integração do chatbot para atendimento", "hours": 20}
-            ],
-            "Thiago": [
-                {"sprint": 1, "task": "Definir estratégia de conteúdo para o site", "hours": 15},
-                {"sprint": 2, "task": "Teste e implementação do chatbot", "hours": 20},
-                {"sprint": 3, "task": "Analisar resultados e propor melhorias contínuas", "hours": 15},
-                {"sprint": 4, "task": "Implementar análise de dados para otimizar o funil", "hours": 10}
-            ],
-            "Ricardo": [
-                {"sprint": 1, "task": "Alinhar requisitos para site e funil automatizado", "hours": 10},
-                {"sprint": 3, "task": "Revisar integração do chatbot e performance do funil", "hours": 8}
-            ],
-            "Alberth": [
-                {"sprint": 1, "task": "Estabelecer estratégia de integração de APIs", "hours": 12},
-                {"sprint": 2, "task": "Monitorar testes e validação do sistema", "hours": 10}
-            ]
-        },
-    },
-}
-
-for company, details in companies.items():
-    with st.expander(f"**{company}**", expanded=False):
-        st.markdown(f"**Descrição:** {details['description']}")
-        st.markdown(f"**Objetivo:** {details['objective']}")
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.subheader("Sprints - Keilon")
-            if "Keilon" in details["sprints"]:
-                for sprint_data in details["sprints"]["Keilon"]:
-                    st.markdown(f"""
-                    <div class="sprint-task">
-                        <strong>Sprint {sprint_data['sprint']}:</strong> {sprint_data['task']} <br>
-                        <em>{sprint_data['hours']} horas</em>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.write("Nenhuma sprint designada para Keilon.")
-        with col2:
-            st.subheader("Sprints - Thiago")
-            if "Thiago" in details["sprints"]:
-                for sprint_data in details["sprints"]["Thiago"]:
-                    st.markdown(f"""
-                    <div class="sprint-task">
-                        <strong>Sprint {sprint_data['sprint']}:</strong> {sprint_data['task']} <br>
-                        <em>{sprint_data['hours']} horas</em>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.write("Nenhuma sprint designada para Thiago.")
-        with col3:
-            st.subheader("Sprints - Ricardo")
-            if "Ricardo" in details["sprints"]:
-                for sprint_data in details["sprints"]["Ricardo"]:
-                    st.markdown(f"""
-                    <div class="sprint-task">
-                        <strong>Sprint {sprint_data['sprint']}:</strong> {sprint_data['task']} <br>
-                        <em>{sprint_data['hours']} horas</em>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.write("Nenhuma sprint designada para Ricardo.")
-        with col4:
-            st.subheader("Sprints - Alberth")
-            if "Alberth" in details["sprints"]:
-                for sprint_data in details["sprints"]["Alberth"]:
-                    st.markdown(f"""
-                    <div class="sprint-task">
-                        <strong>Sprint {sprint_data['sprint']}:</strong> {sprint_data['task']} <br>
-                        <em>{sprint_data['hours']} horas</em>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.write("Nenhuma sprint designada para Alberth.")
+# -----------------------------------------------------------------------------
+# Renderização das sprints por pessoa
+# -----------------------------------------------------------------------------
+COLUNAS_POR_LINHA = 4
+# Opção de ordenação -> (coluna, ascendente); None mantém a ordem planejada.
+ORDENACOES = {"Planejamento": None, "Sprint": ("sprint", True), "Horas": ("horas", False)}
+
+
+def renderizar_sprints(tarefas_empresa, ordenacao=None):
+    """Uma coluna por pessoa com tarefas na empresa, em linhas de até
+    `COLUNAS_POR_LINHA` colunas, com um único `st.markdown` por pessoa."""
+    grupos = list(tarefas_empresa.groupby("pessoa", observed=True, sort=False))
+    if not grupos:
+        st.write("Nenhuma sprint designada.")
+        return
+    for inicio in range(0, len(grupos), COLUNAS_POR_LINHA):
+        linha = grupos[inicio:inicio + COLUNAS_POR_LINHA]
+        for col, (pessoa, tarefas_pessoa) in zip(st.columns(COLUNAS_POR_LINHA), linha):
+            if ordenacao is not None:
+                coluna, ascendente = ordenacao
+                tarefas_pessoa = tarefas_pessoa.sort_values(coluna, ascending=ascendente, kind="stable")
+            with col:
+                st.subheader(f"Sprints - {pessoa}")
+                st.markdown(proposta_conteudo.html_tarefas(tarefas_pessoa), unsafe_allow_html=True)
+
+
+# Fragmento: filtrar ou ordenar dentro de um cartão reexecuta só esse cartão,
+# sem repassar pelo restante da página.
+@st.fragment
+def cartao_empresa(empresa, descricao, objetivo, tarefas_empresa, codigo):
+    with st.expander(f"**{empresa}**", expanded=False):
+        st.markdown(f"**Descrição:** {descricao}")
+        st.markdown(f"**Objetivo:** {objetivo}")
+        percentual, concluidas, planejadas = progresso.progresso_empresa(codigo)
+        if planejadas > 0:
+            st.caption(f"Progresso: {percentual:.0f}% ({concluidas:g} de {planejadas:g} horas concluídas)")
+        col_pessoas, col_ordem = st.columns([3, 2])
+        with col_pessoas:
+            pessoas = st.multiselect(
+                "Pessoas", list(tarefas_empresa["pessoa"].unique()), placeholder="Todas",
+                key=f"pessoas_{empresa}",
+            )
+        with col_ordem:
+            ordem = st.radio("Ordenar por", list(ORDENACOES), horizontal=True, key=f"ordem_{empresa}")
+        if pessoas:
+            tarefas_empresa = tarefas_empresa[tarefas_empresa["pessoa"].isin(pessoas)]
+        if st.toggle("Atualizar status", key=f"editar_status_{empresa}"):
+            editar_status(empresa, tarefas_empresa)
+        renderizar_sprints(tarefas_empresa, ORDENACOES[ordem])
+
+
+def editar_status(empresa, tarefas_empresa):
+    """Tabela editável com o status das tarefas do cartão. Cada mudança vai
+    para `atualizar_status` (O(1) por tarefa) do progresso fixado e a página
+    é reexecutada para o roadmap refletir os novos totais. As mudanças valem
+    até os arquivos de tarefas mudarem (ver `fixar_progresso`)."""
+    chave = f"status_{empresa}"
+    linhas = tarefas_empresa.index.to_numpy()
+    atual = tarefas_empresa[["pessoa", "sprint", "tarefa", "horas"]].assign(status=progresso.status(linhas))
+    st.caption("Os status alterados aqui valem até a próxima mudança nos arquivos de tarefas.")
+    editada = st.data_editor(
+        atual,
+        key=chave,
+        hide_index=True,
+        disabled=["pessoa", "sprint", "tarefa", "horas"],
+        column_config={"status": st.column_config.SelectboxColumn("status", options=proposta_dados.STATUS, required=True)},
+    )
+    mudancas = editada["status"].astype(str).to_numpy() != atual["status"].astype(str).to_numpy()
+    if mudancas.any():
+        editado = fixar_progresso(*chave_progresso, progresso)
+        for linha, status in zip(linhas[mudancas], editada["status"].astype(str).to_numpy()[mudancas]):
+            editado.atualizar_status(int(linha), status)
+        # As edições já foram aplicadas; o editor volta a partir dos status atuais.
+        del st.session_state[chave]
+        st.rerun()
+
+
+
+@memorizar
+def carregar_indice(versao, _empresas, _tarefas):
+    """Índice de busca, construído uma vez por versão dos dados."""
+    return proposta_busca.IndiceBusca(_empresas, _tarefas)
+
+
+LIMITE_EMPRESAS_BUSCA = 20
+
+
+# Fragmento: digitar na busca reexecuta só este bloco.
+@st.fragment
+def busca_tarefas(versao, empresas, tarefas):
+    consulta = st.text_input(
+        "Buscar tarefas", placeholder="Ex.: chatbot, whatsapp, integracao", key="busca_tarefas"
+    )
+    if not consulta.strip():
+        return
+    indice = carregar_indice(versao, empresas, tarefas)
+    inicio = time.perf_counter()
+    resultado = indice.buscar(consulta)
+    duracao_ms = (time.perf_counter() - inicio) * 1000
+    por_empresa = resultado.groupby("empresa", observed=True, sort=False)
+    st.caption(
+        f"{len(resultado)} tarefas em {por_empresa.ngroups} empresas ({duracao_ms:.1f} ms)"
+    )
+    for n, (empresa, tarefas_empresa) in enumerate(por_empresa):
+        if n == LIMITE_EMPRESAS_BUSCA:
+            st.caption(f"Mostrando as primeiras {LIMITE_EMPRESAS_BUSCA} empresas; refine a busca para ver as demais.")
+            break
+        itens = "\n".join(
+            f"- Sprint {sprint} · {pessoa}: {tarefa} ({horas:g} horas)"
+            for pessoa, sprint, tarefa, horas in zip(
+                tarefas_empresa["pessoa"], tarefas_empresa["sprint"], tarefas_empresa["tarefa"], tarefas_empresa["horas"]
+            )
+        )
+        st.markdown(f"**{empresa}** ({len(tarefas_empresa)})\n\n{itens}")
+
+
+busca_tarefas(versao_tarefas, empresas_df, tarefas_df)
+
+# Só as empresas da página atual (após o filtro) são renderizadas, então o custo
+# da seção não cresce com o número total de empresas.
+col_filtro, col_tamanho, col_pagina = st.columns([3, 1, 1])
+with col_filtro:
+    filtro_empresas = st.text_input(
+        "Filtrar empresas", placeholder="Nome, descrição ou objetivo", key="filtro_empresas"
+    )
+with col_tamanho:
+    tamanho_pagina = st.selectbox("Empresas por página", [10, 25, 50, 100], key="tamanho_pagina")
+
+empresas_filtradas = empresas_df
+if filtro_empresas:
+    termo = filtro_empresas.strip()
+    encontradas = (
+        empresas_df.index.str.contains(termo, case=False, regex=False)
+        | empresas_df["descricao"].str.contains(termo, case=False, regex=False)
+        | empresas_df["objetivo"].str.contains(termo, case=False, regex=False)
+    )
+    empresas_filtradas = empresas_df[encontradas]
+
+total_paginas = max(1, math.ceil(len(empresas_filtradas) / tamanho_pagina))
+if st.session_state.get("pagina_empresas", 1) > total_paginas:
+    st.session_state["pagina_empresas"] = total_paginas
+with col_pagina:
+    pagina = st.number_input("Página", min_value=1, max_value=total_paginas, step=1, key="pagina_empresas")
+
+inicio_pagina = (pagina - 1) * tamanho_pagina
+empresas_pagina = empresas_filtradas.iloc[inicio_pagina:inicio_pagina + tamanho_pagina]
+if empresas_pagina.empty:
+    st.info("Nenhuma empresa encontrada.")
+else:
+    st.caption(
+        f"Mostrando {inicio_pagina + 1}–{inicio_pagina + len(empresas_pagina)} "
+        f"de {len(empresas_filtradas)} empresas"
+    )
+
+for company, details in empresas_pagina.iterrows():
+    cartao_empresa(
+        company, details["descricao"], details["objetivo"], tarefas_df.iloc[details["inicio"]:details["fim"]],
+        empresas_df.index.get_loc(company),
+    )
 st.write("---")
 
 # =============================================================================
-# 7. PRODUTIVIDADE: FERRAMENTAS E ESTRATÉGIAS
+# 7. CARGA DE TRABALHO E CAPACIDADE
 # =============================================================================
+cronometro.secao("7. Carga de trabalho")
+import altair as alt
+
+st.subheader("Carga de Trabalho e Capacidade")
+
+
+@memorizar
+def carregar_carga(versao, _tarefas):
+    """Matrizes de horas por sprint (ver `proposta_analise.agregar_carga`),
+    calculadas uma vez por versão dos dados; os filtros abaixo só as recortam."""
+    return proposta_analise.agregar_carga(_tarefas)
+
+
+carga = carregar_carga(versao_tarefas, tarefas_df)
+
+col_capacidade, col_pessoas, col_limite = st.columns([1, 3, 1])
+with col_capacidade:
+    capacidade = st.number_input(
+        "Capacidade por sprint (horas/pessoa)", min_value=1, value=40, step=5, key="capacidade_sprint"
+    )
+with col_pessoas:
+    pessoas_carga = st.multiselect(
+        "Pessoas", list(carga["pessoa"].index), placeholder="Todas", key="pessoas_carga"
+    )
+with col_limite:
+    limite_empresas = st.number_input(
+        "Empresas no mapa", min_value=1, max_value=500, value=25, step=5, key="limite_empresas"
+    )
+
+carga_pessoa = carga["pessoa"].loc[pessoas_carga] if pessoas_carga else carga["pessoa"]
+uso = proposta_analise.utilizacao(carga_pessoa, capacidade)
+acima = proposta_analise.excesso(carga_pessoa, capacidade)
+
+metrica_horas, metrica_uso, metrica_excesso = st.columns(3)
+metrica_horas.metric("Horas planejadas", f"{carga_pessoa.to_numpy().sum():,.0f}".replace(",", "."))
+metrica_uso.metric("Utilização média", f"{uso.to_numpy().mean():.0f}%")
+metrica_excesso.metric("Sprints acima da capacidade", int((acima.to_numpy() > 0).sum()))
+
+aba_pessoas, aba_empresas = st.tabs(["Pessoa × Sprint", "Empresa × Sprint"])
+with aba_pessoas:
+    dados_uso = proposta_analise.formato_longo(uso, "utilizacao").assign(
+        horas=carga_pessoa.to_numpy().ravel(),
+        excesso=acima.to_numpy().ravel(),
+    )
+    mapa_pessoas = alt.Chart(dados_uso).mark_rect().encode(
+        x=alt.X("sprint:O", title="Sprint"),
+        y=alt.Y("pessoa:N", title=None, sort=None),
+        color=alt.Color(
+            "utilizacao:Q", title="Utilização (%)",
+            scale=alt.Scale(scheme="redyellowgreen", reverse=True, domain=[0, 150], clamp=True),
+        ),
+        tooltip=[
+            alt.Tooltip("pessoa:N", title="Pessoa"),
+            alt.Tooltip("sprint:O", title="Sprint"),
+            alt.Tooltip("horas:Q", title="Horas", format=".0f"),
+            alt.Tooltip("utilizacao:Q", title="Utilização (%)", format=".0f"),
+            alt.Tooltip("excesso:Q", title="Horas acima", format=".0f"),
+        ],
+    )
+    st.altair_chart(mapa_pessoas)
+    if (acima.to_numpy() > 0).any():
+        sobrecarga = proposta_analise.formato_longo(acima, "excesso")
+        st.dataframe(
+            sobrecarga[sobrecarga["excesso"] > 0].rename(
+                columns={"pessoa": "Pessoa", "sprint": "Sprint", "excesso": "Horas acima da capacidade"}
+            ),
+            hide_index=True,
+        )
+with aba_empresas:
+    carga_empresa = carga["empresa"]
+    mais_carregadas = carga_empresa.sum(axis=1).nlargest(int(limite_empresas)).index
+    mapa_empresas = alt.Chart(
+        proposta_analise.formato_longo(carga_empresa.loc[mais_carregadas], "horas")
+    ).mark_rect().encode(
+        x=alt.X("sprint:O", title="Sprint"),
+        y=alt.Y("empresa:N", title=None, sort=None),
+        color=alt.Color("horas:Q", title="Horas", scale=alt.Scale(scheme="blues")),
+        tooltip=[
+            alt.Tooltip("empresa:N", title="Empresa"),
+            alt.Tooltip("sprint:O", title="Sprint"),
+            alt.Tooltip("horas:Q", title="Horas", format=".0f"),
+        ],
+    )
+    st.altair_chart(mapa_empresas)
+st.write("---")
+
+# =============================================================================
+# 8. LINHA DO TEMPO DAS SPRINTS
+# =============================================================================
+cronometro.secao("8. Linha do tempo")
+st.subheader("Linha do Tempo das Sprints")
+
+
+# Fragmento: mudar o agrupamento ou o detalhe reexecuta só este bloco. A visão
+# geral parte das matrizes de `carregar_carga` (pontos limitados pelo número
+# de linhas); o detalhe por tarefa só é montado quando uma empresa é escolhida.
+@st.fragment
+def linha_do_tempo(carga, meses, empresas, tarefas):
+    col_agrupar, col_linhas, col_detalhe = st.columns([1, 1, 2])
+    with col_agrupar:
+        agrupar = st.radio("Agrupar por", ["Empresa", "Pessoa"], horizontal=True, key="gantt_agrupar")
+    with col_linhas:
+        max_linhas = st.slider("Linhas", min_value=5, max_value=200, value=40, step=5, key="gantt_linhas")
+    matriz = carga["empresa" if agrupar == "Empresa" else "pessoa"]
+    figura, barras = proposta_gantt.figura_agregada(matriz, meses, max_linhas)
+    with col_detalhe:
+        empresas_visiveis = [str(nome) for nome in matriz.sum(axis=1).nlargest(max_linhas).index] if agrupar == "Empresa" else []
+        detalhe = st.selectbox(
+            "Detalhar empresa", empresas_visiveis, index=None, placeholder="Escolha uma empresa do gráfico",
+            key="gantt_detalhe", disabled=not empresas_visiveis,
+        )
+    st.plotly_chart(figura, key="gantt_geral")
+    st.caption(f"{barras} barras agregadas por sprint ({'WebGL' if barras > proposta_gantt.LIMITE_WEBGL else 'SVG'}).")
+    if detalhe is not None:
+        linha = empresas.loc[detalhe]
+        figura, barras = proposta_gantt.figura_detalhada(tarefas.iloc[linha["inicio"]:linha["fim"]], meses)
+        st.markdown(f"**{detalhe}**: tarefas por pessoa")
+        st.plotly_chart(figura, key="gantt_detalhe_grafico")
+        st.caption(f"{barras} tarefas ({'WebGL' if barras > proposta_gantt.LIMITE_WEBGL else 'SVG'}).")
+
+
+linha_do_tempo(carga, sprints_meses, empresas_df, tarefas_df)
+st.write("---")
+
+# =============================================================================
+# 9. PRODUTIVIDADE: FERRAMENTAS E ESTRATÉGIAS
+# =============================================================================
+cronometro.secao("9. Produtividade")
 st.subheader("Produtividade: Ferramentas e Estratégias")
-st.write("""
-- **Centralização:** Utilização de Jira, Asana ou Notion para gerenciamento de backlogs e sprints.
-- **Alertas e Automação:** Make.com para alertas e relatórios em tempo real.
-- **Reuniões Ágeis:** Daily Stand-ups (15 min) e reuniões estratégicas (30-60 min, 3x por semana).
-- **Base de Conhecimento:** Documentação detalhada e acessível das integrações e processos.
-- **Gestão de Escopo:** Definição clara de limites e reconhecimento das restrições técnicas.
-""")
+st.write(proposta_conteudo.PRODUTIVIDADE)
 st.write("---")
 
 # =============================================================================
-# 8. FERRAMENTAS E CUSTOS (PRÉVIA)
+# 10. FERRAMENTAS E CUSTOS (PRÉVIA)
 # =============================================================================
+cronometro.secao("10. Ferramentas e custos")
 st.subheader("Ferramentas e Custos")
-ferramentas = [
-    {"Ferramenta": "ChatGPT", "Descrição": "Assistente de IA e geração de conteúdo", "Custo": "Gratuito / ChatGPT Plus: US$20/mês"},
-    {"Ferramenta": "ManyChat", "Descrição": "Plataforma de automação de chatbots", "Custo": "A partir de US$10/mês (varia conforme assinantes)"},
-    {"Ferramenta": "Tray", "Descrição": "Plataforma de ecommerce", "Custo": "Planos a partir de R$49/mês"},
-    {"Ferramenta": "Olist CMS Ecommerce", "Descrição": "Solução CMS para ecommerce", "Custo": "A partir de R$200/mês (aproximado)"},
-    {"Ferramenta": "Bling", "Descrição": "ERP e gestão para ecommerce", "Custo": "Planos a partir de R$29/mês"}
-]
-ferramentas_df = pd.DataFrame(ferramentas)
-st.table(ferramentas_df)
+versao_ferramentas, caminhos_ferramentas = fonte_versionada("ferramentas")
+ferramentas = carregar_ferramentas(versao_ferramentas, caminhos_ferramentas)
+cotacoes = carregar_cotacoes(*fonte_versionada("cotacoes"))
+
+
+@memorizar
+def carregar_custos(versao, _ferramentas):
+    """Custos estruturados (ver `proposta_custos.tabela_custos`), interpretados
+    uma vez por versão do arquivo de ferramentas."""
+    return proposta_custos.tabela_custos(_ferramentas)
+
+
+@memorizar
+def carregar_equipes(versao, _empresas, _tarefas):
+    return proposta_custos.equipe_por_empresa(_empresas, _tarefas)
+
+
+custos = carregar_custos(versao_ferramentas, ferramentas)
+ferramentas_df = pd.DataFrame(ferramentas).assign(
+    **{"Valor": custos["valor"].to_numpy(), "Moeda": custos["moeda"].to_numpy(),
+       "Mensal (R$)": proposta_custos.mensal_em_reais(custos, cotacoes)}
+)
+st.dataframe(ferramentas_df, hide_index=True)
+if not custos["reconhecido"].all():
+    st.warning(
+        "Custo sem preço ou período reconhecível, fora da projeção: "
+        + ", ".join(map(str, custos.index[~custos["reconhecido"]]))
+        + "."
+    )
+
+
+# Fragmento: os controles de simulação reexecutam só a projeção, que refaz
+# apenas as contas vetorizadas sobre os custos já interpretados.
+@st.fragment
+def projecao_custos(custos, cotacoes, equipe, empresas, meses):
+    st.markdown(f"**Projeção de custos ({meses} meses)**")
+    moedas = [moeda for moeda in custos["moeda"].dropna().unique() if moeda != "BRL"]
+    col_assentos, col_gratuito, *cols_moedas = st.columns([2, 2] + [1] * len(moedas))
+    with col_assentos:
+        assentos_extras = st.slider("Assentos extras por empresa", 0, 20, 0, key="assentos_extras")
+    with col_gratuito:
+        usar_gratuito = st.toggle("Usar planos gratuitos quando houver", key="usar_gratuito")
+    cotacoes_simuladas = {**proposta_custos.COTACOES_PADRAO, **cotacoes}
+    for col, moeda in zip(cols_moedas, moedas):
+        with col:
+            cotacoes_simuladas[moeda] = st.number_input(
+                f"{moeda} (R$)", min_value=0.0, value=float(cotacoes_simuladas.get(moeda, 1.0)), step=0.05,
+                key=f"cotacao_{moeda}",
+            )
+
+    assentos, mensal = proposta_custos.projetar(
+        custos, equipe, cotacoes_simuladas, assentos_extras=assentos_extras, usar_gratuito=usar_gratuito
+    )
+    cenarios = list(proposta_custos.CENARIOS_ASSENTOS)
+    for i, (col, cenario) in enumerate(zip(st.columns(len(cenarios)), cenarios)):
+        col.metric(
+            f"{cenario}: total em {meses} meses", f"R$ {mensal[i].sum() * meses:,.2f}",
+            f"R$ {mensal[i].sum():,.2f}/mês", delta_color="off",
+        )
+    formato_reais = st.column_config.NumberColumn(format="%.2f")
+    st.dataframe(
+        proposta_custos.resumo_projecao(empresas, assentos, mensal, meses),
+        column_config={
+            coluna: formato_reais
+            for cenario in cenarios
+            for coluna in (f"{cenario} · mensal (R$)", f"{cenario} · {meses} meses (R$)")
+        },
+    )
+
+projecao_custos(
+    custos, cotacoes, carregar_equipes(versao_tarefas, empresas_df, tarefas_df), empresas_df.index, len(roadmap_data)
+)
 st.write("---")
 
 # =============================================================================
-# 9. FLUXO DE TRABALHO SCRUM
+# 11. FLUXO DE TRABALHO SCRUM
 # =============================================================================
+cronometro.secao("11. Fluxo Scrum")
 st.subheader("Fluxo de Trabalho Scrum: Iterativo e Adaptável")
-st.write("""
-Adotamos o framework **Scrum** para estruturar nossos ciclos de entrega em sprints de 2 semanas, garantindo feedback rápido e adaptação contínua. O fluxograma abaixo ilustra o processo:
-""")
-if graphviz_installed:
-    flowchart = """
-    digraph G {
-        rankdir=TB;
-        node [shape=box, style="rounded,filled", fillcolor="#DAE8FC", color="#6C8EBF", fontcolor="#333333", fontsize=12, margin="0.2,0.1"];
-        edge [color="#6C8EBF", fontcolor="#333333"];
-
-        Stakeholder [label="Stakeholder", fillcolor="#B9D0EE"];
-        Client [label="Client Liaison", fillcolor="#B9D0EE"];
-        ProductOwner [label="Product Owner\n(Ricardo)"];
-        ProductBacklog [label="Product Backlog"];
-        SprintBacklog [label="Sprint Backlog"];
-        SprintStart [label="Sprint Start"];
-        DailyScrum [label="Daily Scrum\n(15 min)"];
-        SprintReview [label="Sprint Review"];
-        SprintRetrospective [label="Sprint Retrospective"];
-        BacklogRefinement [label="Backlog Refinement"];
-        FinalDelivery [label="Entrega Final", shape=doublecircle, fillcolor="#90EE90"];
-
-        Stakeholder -> Client;
-        Client -> ProductOwner;
-        ProductOwner -> ProductBacklog;
-        ProductBacklog -> SprintBacklog [label="Selecionar Itens"];
-        SprintBacklog -> SprintStart;
-        SprintStart -> DailyScrum;
-        DailyScrum -> SprintReview [label="Fim da Sprint"];
-        SprintReview -> SprintRetrospective [label="Feedback"];
-        SprintRetrospective -> BacklogRefinement [label="Ajustes"];
-        BacklogRefinement -> ProductBacklog [label="Atualização"];
-        SprintReview -> FinalDelivery [label="Lançamento"];
-
-        {rank=same; SprintReview; SprintRetrospective}
-    }
-    """
-    st.graphviz_chart(flowchart)
+st.write(proposta_conteudo.FLUXO_INTRODUCAO)
+
+
+@memorizar
+def carregar_fluxo(versao, caminhos):
+    """Fluxograma da proposta (`fluxo.json`) ou, sem o arquivo, o fluxo Scrum padrão."""
+    return proposta_dados.ler_fluxo(caminhos) or proposta_conteudo.FLUXO_SCRUM
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def svg_fluxograma(chave, _dot):
+    """SVG do fluxograma identificado por `chave` (hash do DOT), mantido em
+    memória sobre o cache em disco de `proposta_conteudo.renderizar_svg`.
+    Retorna None quando o Graphviz não está disponível."""
+    return proposta_conteudo.renderizar_svg(_dot)
+
+
+flowchart = proposta_conteudo.montar_dot(carregar_fluxo(*fonte_versionada("fluxo")))
+svg = svg_fluxograma(proposta_conteudo.chave_dot(flowchart), flowchart)
+if svg is not None:
+    st.image(svg)
 else:
-    st.warning("Graphviz não está instalado.")
+    # Sem o Graphviz no servidor, o layout é feito pelo navegador.
+    st.graphviz_chart(flowchart)
 st.write("---")
 
 # =============================================================================
-# 10. CONSIDERAÇÕES FINAIS
+# 12. CONSIDERAÇÕES FINAIS
 # =============================================================================
+cronometro.secao("12. Considerações finais")
 st.subheader("Considerações Finais")
-st.write("""
-Esta proposta foi elaborada para transformar digitalmente sua organização, promovendo agilidade, inovação e resultados mensuráveis.  
-Com o uso do **Scrum**, integração de automações e foco em dados, estamos preparados para transformar desafios em oportunidades de crescimento e sucesso.
-""")
-st.success("Obrigado por analisar esta proposta. Vamos transformar seus objetivos em realidade!")
+st.write(proposta_conteudo.CONSIDERACOES_FINAIS)
+st.success(proposta_conteudo.AGRADECIMENTO)
+
+# -----------------------------------------------------------------------------
+# Atualização ao vivo
+# -----------------------------------------------------------------------------
+# Um único observador por proposta confere os arquivos em segundo plano (ver
+# proposta_observador.py); cada sessão só consulta, em memória, o que mudou
+# desde a versão que ela exibiu. Qualquer mudança de conteúdo reexecuta a
+# página, mesmo que só atinja empresas fora da página atual: carga, linha do
+# tempo, custos e busca somam ou indexam todas as empresas. Uma gravação que
+# não muda o conteúdo não reexecuta nada, e os cartões e colunas que não
+# mudaram saem dos caches com o mesmo conteúdo.
+INTERVALO_AO_VIVO = float(os.environ.get("PROPOSTA_INTERVALO_AO_VIVO", "2"))
+
+
+@st.cache_resource
+def observadores():
+    """Diretório -> Observador das propostas acompanhadas ao vivo, e o lock
+    que protege o dict."""
+    return {}, threading.Lock()
+
+
+def observador_proposta(diretorio):
+    """Observador da proposta, criado na primeira consulta. Os observadores
+    cuja thread já parou por ociosidade são descartados, então só ficam em
+    memória os das propostas acompanhadas recentemente."""
+    registro, lock = observadores()
+    with lock:
+        for ocioso in [d for d, observador in registro.items() if observador.ocioso()]:
+            del registro[ocioso]
+        if diretorio not in registro:
+            registro[diretorio] = proposta_observador.Observador(
+                diretorio, carregar_roadmap, carregar_tabelas, intervalo=INTERVALO_AO_VIVO
+            )
+        return registro[diretorio]
+
+
+@st.fragment(run_every=INTERVALO_AO_VIVO)
+def acompanhar_alteracoes(observador):
+    chave = f"versao_exibida_{observador.diretorio}"
+    if chave not in st.session_state:
+        st.session_state[chave] = observador.versao
+    versao, empresas, meses, estrutura = observador.alteracoes_desde(st.session_state[chave])
+    st.caption(f"Ao vivo: versão {versao} dos dados, conferida a cada {observador.intervalo:g} s.")
+    if observador.ultimo_erro:
+        st.caption(f"Última leitura falhou: {observador.ultimo_erro}")
+    if versao == st.session_state[chave]:
+        return
+    st.session_state[chave] = versao
+    if empresas is None or estrutura or meses or empresas:
+        st.session_state["aviso_ao_vivo"] = (
+            "Dados atualizados." if empresas is None
+            else f"Atualizados: {len(empresas)} empresa(s), {len(meses)} mês(es) do roadmap."
+        )
+        st.rerun()
+
+
+if ao_vivo:
+    with st.sidebar:
+        if "aviso_ao_vivo" in st.session_state:
+            st.toast(st.session_state.pop("aviso_ao_vivo"))
+        acompanhar_alteracoes(observador_proposta(diretorio_proposta))
+else:
+    # Ao religar, a sessão parte da versão atual do observador (que pode ter
+    # sido descartado e recriado nesse meio-tempo).
+    st.session_state.pop(f"versao_exibida_{diretorio_proposta}", None)
+cronometro.finalizar()
+
+if painel_desempenho:
+    registro = registro_desempenho()
+    with st.sidebar:
+        st.subheader("Desempenho por seção")
+        st.caption(f"Últimas {len(registro)} medições, de todas as sessões.")
+        st.dataframe(registro.resumo())
+        st.download_button(
+            "Exportar JSON lines", registro.jsonl(), file_name="desempenho.jsonl", mime="application/x-ndjson"
+        )
+        metricas = cache_propostas().metricas()
+        st.subheader("Cache de propostas")
+        st.caption(
+            f"{metricas['entradas']} entradas, {metricas['bytes'] / 2**20:.1f} de "
+            f"{metricas['limite_bytes'] / 2**20:.0f} MB; {metricas['acertos']} acertos, "
+            f"{metricas['faltas']} faltas, {metricas['despejos']} despejos "
+            f"({metricas['bytes_despejados'] / 2**20:.1f} MB)."
+        )
+        st.dataframe(
+            pd.Series(metricas["bytes_por_funcao"], name="bytes", dtype="int64").rename_axis("função"),
+        )
@@ -0,0 +1,237 @@
+"""Exporta a proposta para um arquivo HTML estático (e, opcionalmente, PDF).
+
+O HTML gerado é autocontido (CSS e fluxograma SVG embutidos) e pode ser
+servido por qualquer servidor de arquivos, sem o Streamlit. O arquivo é
+escrito seção a seção, empresa a empresa, então propostas grandes nunca ficam
+inteiras em memória como texto.
+
+Uso:
+    python exportar_proposta.py proposta.html
+    python exportar_proposta.py proposta.html --dados caminho/da/proposta --pdf proposta.pdf
+"""
+import argparse
+import html
+import sys
+
+import pandas as pd
+
+import proposta_analise
+import proposta_conteudo
+import proposta_dados
+
+CSS_EXPORTACAO = """
+<style>
+.pagina {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+.legenda {
+    color: #6c757d;
+    font-size: 0.9rem;
+    margin: 0.2rem 0;
+}
+.colunas {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
+    gap: 1rem;
+}
+.barra-progresso {
+    background-color: #e9ecef;
+    border-radius: 6px;
+    height: 0.5rem;
+    margin: 0.5rem 0;
+}
+.barra-progresso > div {
+    background-image: linear-gradient(to right, #4facfe, #00f2fe);
+    border-radius: 6px;
+    height: 100%;
+}
+details.stExpander {
+    padding: 0.5rem 1rem;
+}
+details.stExpander > summary {
+    cursor: pointer;
+}
+table.ferramentas {
+    border-collapse: collapse;
+    width: 100%;
+}
+table.ferramentas th, table.ferramentas td {
+    border-bottom: 1px solid #ddd;
+    padding: 0.5rem;
+    text-align: left;
+}
+.sucesso {
+    background-color: #d4edda;
+    border-radius: 6px;
+    color: #155724;
+    padding: 1rem;
+}
+.fluxograma svg {
+    max-width: 100%;
+    height: auto;
+}
+hr {
+    border: none;
+    border-top: 1px solid #ddd;
+    margin: 2rem 0;
+}
+</style>
+"""
+
+
+def _e(texto):
+    return html.escape(str(texto), quote=False)
+
+
+def secao_cabecalho():
+    yield f"<h1>{_e(proposta_conteudo.TITULO)}</h1>\n"
+    yield f"<h3>{_e(proposta_conteudo.SUBTITULO)}</h3>\n"
+    for legenda in proposta_conteudo.LEGENDAS:
+        yield f'<p class="legenda">{_e(legenda)}</p>\n'
+
+
+def secao_texto(titulo, texto):
+    yield f"<h2>{_e(titulo)}</h2>\n"
+    yield proposta_conteudo.markdown_para_html(texto) + "\n"
+
+
+def secao_roadmap(roadmap_data, tarefas):
+    yield "<h2>Roadmap de Implementação</h2>\n"
+    yield '<div class="colunas">\n'
+    concluidas, planejadas = proposta_analise.ProgressoRoadmap(
+        tarefas, list(proposta_analise.sprints_dos_meses(roadmap_data).values())
+    ).totais_meses()
+    for i, (mes, dados_mes) in enumerate(roadmap_data.items()):
+        if planejadas[i] > 0:
+            progresso = min(100.0, concluidas[i] * 100 / planejadas[i])
+            legenda = f"{progresso:.0f}% · {concluidas[i]:g} de {planejadas[i]:g} horas"
+        else:
+            progresso, legenda = 0, "Sem horas planejadas"
+        yield (
+            f"<div><strong>{_e(mes)}</strong>"
+            f'<div class="barra-progresso"><div style="width: {progresso:.1f}%"></div></div>'
+            f'<p class="legenda">{_e(legenda)}</p>'
+            f'<details class="stExpander"><summary>Detalhes de {_e(mes)}</summary>'
+            f"{proposta_conteudo.html_detalhes_mes(dados_mes)}</details></div>\n"
+        )
+    yield "</div>\n"
+
+
+def secao_empresas(empresas, tarefas):
+    yield "<h2>Projetos e Sprints Dedicadas</h2>\n"
+    for empresa, descricao, objetivo, inicio, fim in empresas[["descricao", "objetivo", "inicio", "fim"]].itertuples():
+        partes = [
+            f'<details class="stExpander company-container">'
+            f'<summary class="streamlit-expanderHeader">{_e(empresa)}</summary>'
+            f"<p><strong>Descrição:</strong> {_e(descricao)}</p>"
+            f"<p><strong>Objetivo:</strong> {_e(objetivo)}</p>"
+        ]
+        grupos = tarefas.iloc[inicio:fim].groupby("pessoa", observed=True, sort=False)
+        if len(grupos):
+            partes.append('<div class="colunas sprint-details">')
+            for pessoa, tarefas_pessoa in grupos:
+                partes.append(
+                    f"<div><h3>Sprints - {_e(pessoa)}</h3>{proposta_conteudo.html_tarefas(tarefas_pessoa)}</div>"
+                )
+            partes.append("</div>")
+        else:
+            partes.append("<p>Nenhuma sprint designada.</p>")
+        partes.append("</details>\n")
+        yield "".join(partes)
+
+
+def secao_ferramentas(ferramentas):
+    yield "<h2>Ferramentas e Custos</h2>\n"
+    tabela = pd.DataFrame(ferramentas)
+    yield '<table class="ferramentas"><thead><tr>'
+    yield "".join(f"<th>{_e(coluna)}</th>" for coluna in tabela.columns)
+    yield "</tr></thead><tbody>\n"
+    for linha in tabela.itertuples(index=False):
+        yield "<tr>" + "".join(f"<td>{_e(valor)}</td>" for valor in linha) + "</tr>\n"
+    yield "</tbody></table>\n"
+
+
+def secao_fluxo(fluxo):
+    yield "<h2>Fluxo de Trabalho Scrum: Iterativo e Adaptável</h2>\n"
+    yield proposta_conteudo.markdown_para_html(proposta_conteudo.FLUXO_INTRODUCAO) + "\n"
+    dot = proposta_conteudo.montar_dot(fluxo)
+    svg = proposta_conteudo.renderizar_svg(dot)
+    if svg is not None:
+        # Remove o prólogo XML/DOCTYPE para embutir o SVG direto no HTML.
+        yield f'<div class="fluxograma">{svg[svg.find("<svg"):]}</div>\n'
+    else:
+        yield (
+            "<p><em>Graphviz não está instalado; segue a descrição do fluxograma em DOT.</em></p>\n"
+            f"<pre>{_e(dot)}</pre>\n"
+        )
+
+
+def secao_final():
+    yield from secao_texto("Considerações Finais", proposta_conteudo.CONSIDERACOES_FINAIS)
+    yield f'<div class="sucesso">{_e(proposta_conteudo.AGRADECIMENTO)}</div>\n'
+
+
+def gerar_html(diretorio=proposta_dados.DIRETORIO_PADRAO):
+    """Gera o HTML da proposta em pedaços, na ordem da página."""
+    fontes = proposta_dados.localizar_fontes(diretorio)
+    # As tarefas alimentam duas seções (progresso do roadmap e empresas) e o
+    # roadmap dá o número de meses da visão geral; ambos são lidos uma vez só.
+    empresas, tarefas = proposta_dados.ler_tabelas(fontes["tarefas"])
+    roadmap_data = proposta_dados.ler_roadmap(fontes["roadmap"])
+    yield (
+        '<!DOCTYPE html>\n<html lang="pt-BR">\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{_e(proposta_conteudo.TITULO)}</title>\n"
+        f"{proposta_conteudo.CUSTOM_CSS}{CSS_EXPORTACAO}</head>\n"
+        '<body>\n<div class="block-container pagina">\n'
+    )
+    secoes = [
+        lambda: secao_cabecalho(),
+        lambda: secao_texto(f"Visão Geral Estratégica ({len(roadmap_data)} Meses)", proposta_conteudo.VISAO_GERAL),
+        lambda: secao_roadmap(roadmap_data, tarefas),
+        lambda: secao_empresas(empresas, tarefas),
+        lambda: secao_texto("Produtividade: Ferramentas e Estratégias", proposta_conteudo.PRODUTIVIDADE),
+        lambda: secao_ferramentas(proposta_dados.ler_ferramentas(fontes["ferramentas"])),
+        lambda: secao_fluxo(proposta_dados.ler_fluxo(fontes["fluxo"]) or proposta_conteudo.FLUXO_SCRUM),
+        lambda: secao_final(),
+    ]
+    for indice, secao in enumerate(secoes):
+        if indice:
+            yield "<hr>\n"
+        # Os demais dados de cada seção são lidos só quando ela é gerada e
+        # liberados em seguida.
+        yield from secao()
+    yield "</div>\n</body>\n</html>\n"
+
+
+def exportar(caminho_html, diretorio=proposta_dados.DIRETORIO_PADRAO):
+    with open(caminho_html, "w", encoding="utf-8") as arquivo:
+        for pedaco in gerar_html(diretorio):
+            arquivo.write(pedaco)
+
+
+def exportar_pdf(caminho_html, caminho_pdf):
+    """Converte o HTML exportado em PDF com o WeasyPrint (opcional)."""
+    try:
+        import weasyprint
+    except ImportError:
+        raise SystemExit("A exportação em PDF requer o pacote weasyprint (pip install weasyprint).")
+    weasyprint.HTML(filename=caminho_html).write_pdf(caminho_pdf)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("saida", help="arquivo HTML a gerar")
+    parser.add_argument("--dados", default=proposta_dados.DIRETORIO_PADRAO, help="diretório da proposta")
+    parser.add_argument("--pdf", metavar="ARQUIVO", help="também gera um PDF a partir do HTML")
+    args = parser.parse_args(argv)
+
+    exportar(args.saida, args.dados)
+    print(f"HTML gravado em {args.saida}", file=sys.stderr)
+    if args.pdf:
+        exportar_pdf(args.saida, args.pdf)
+        print(f"PDF gravado em {args.pdf}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
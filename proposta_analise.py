@@ -0,0 +1,176 @@
+"""Agregações de carga de trabalho sobre a tabela colunar de tarefas.
+
+As funções recebem a tabela `tarefas` de `proposta_dados` (empresa e pessoa
+categóricas) e trabalham sobre os códigos das categorias com `np.bincount`,
+sem laços em Python por tarefa.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from proposta_dados import STATUS
+
+# Sprints de 2 semanas: sem a lista `sprints` de um mês no roadmap, cada mês
+# cobre duas sprints consecutivas.
+SPRINTS_POR_MES = 2
+
+CONCLUIDA = STATUS.index("concluida")
+
+
+def _matriz(tarefas, coluna, sprints):
+    """Soma as horas por categoria de `coluna` × sprint numa matriz densa."""
+    categorias = tarefas[coluna].cat.categories
+    codigos = tarefas[coluna].cat.codes.to_numpy().astype(np.int64)
+    horas = tarefas["horas"].to_numpy(dtype=np.float64)
+    posicao_sprint = tarefas["sprint"].to_numpy().astype(np.int64) - sprints[0]
+    validos = codigos >= 0
+    indices = codigos[validos] * len(sprints) + posicao_sprint[validos]
+    soma = np.bincount(indices, weights=horas[validos], minlength=len(categorias) * len(sprints))
+    return pd.DataFrame(
+        soma.reshape(len(categorias), len(sprints)),
+        index=pd.Index(categorias, name=coluna),
+        columns=pd.Index(sprints, name="sprint"),
+    )
+
+
+def agregar_carga(tarefas):
+    """Horas por pessoa × sprint e por empresa × sprint.
+
+    Retorna um dict com as matrizes `pessoa` e `empresa` (linhas na ordem das
+    categorias, uma coluna por sprint entre a menor e a maior da tabela).
+    """
+    if tarefas.empty:
+        sprints = np.arange(1, 2)
+    else:
+        sprint = tarefas["sprint"].to_numpy()
+        sprints = np.arange(int(sprint.min()), int(sprint.max()) + 1)
+    return {
+        "pessoa": _matriz(tarefas, "pessoa", sprints),
+        "empresa": _matriz(tarefas, "empresa", sprints),
+    }
+
+
+def utilizacao(carga_pessoa, capacidade):
+    """Percentual da capacidade por sprint (em horas) usado por pessoa × sprint."""
+    return carga_pessoa * (100.0 / capacidade)
+
+
+def excesso(carga_pessoa, capacidade):
+    """Horas acima da capacidade por pessoa × sprint (zero quando dentro dela)."""
+    return (carga_pessoa - capacidade).clip(lower=0)
+
+
+def formato_longo(matriz, valor):
+    """Converte uma matriz categoria × sprint em linhas (categoria, sprint, valor)."""
+    longo = matriz.stack().rename(valor).reset_index()
+    longo[matriz.index.name] = longo[matriz.index.name].astype(str)
+    return longo
+
+
+def sprints_dos_meses(roadmap_data):
+    """Dict mês -> tupla das sprints que ele cobre, a partir da lista
+    `sprints` de cada mês do roadmap. Um mês sem a lista cobre as
+    `SPRINTS_POR_MES` sprints da sua posição (o mês i, as sprints 2i + 1 e
+    2i + 2)."""
+    meses = {}
+    vistas = {}
+    for i, (mes, dados_mes) in enumerate(roadmap_data.items()):
+        sprints = dados_mes.get("sprints")
+        if sprints is None:
+            sprints = range(i * SPRINTS_POR_MES + 1, (i + 1) * SPRINTS_POR_MES + 1)
+        meses[mes] = tuple(int(sprint) for sprint in sprints)
+        for sprint in meses[mes]:
+            if sprint in vistas:
+                raise ValueError(f"Sprint {sprint} listada em {vistas[sprint]} e em {mes} no roadmap.")
+            vistas[sprint] = mes
+    return meses
+
+
+def mes_da_sprint(sprint, sprints_meses):
+    """Índice do mês do roadmap (0 a len(sprints_meses) - 1) de cada sprint,
+    dadas as sprints de cada mês (valores de `sprints_dos_meses`). Uma sprint
+    fora de todos os meses conta no mês da sprint anterior mais próxima
+    (ou no primeiro mês, se não houver)."""
+    sprint = np.asarray(sprint, dtype=np.int64)
+    listadas = [s for sprints in sprints_meses for s in sprints]
+    maior = max(listadas + [int(sprint.max()) if sprint.size else 0, 0])
+    tabela = np.full(maior + 1, -1, dtype=np.int64)
+    for i, sprints in enumerate(sprints_meses):
+        tabela[[s for s in sprints if s >= 0]] = i
+    # Sprints não listadas herdam o mês da sprint listada anterior mais próxima.
+    anterior = np.maximum.accumulate(np.where(tabela >= 0, np.arange(maior + 1), 0))
+    tabela = np.where(tabela >= 0, tabela, tabela[anterior]).clip(0)
+    return tabela[sprint.clip(0, maior)]
+
+
+class ProgressoRoadmap:
+    """Horas planejadas e concluídas por mês do roadmap e por empresa.
+
+    Os totais são somados uma vez, na construção; depois disso cada mudança
+    de status de uma tarefa (`atualizar_status`) ajusta só o mês e a empresa
+    dela, em O(1). Leituras e atualizações são protegidas por um lock, porque
+    a mesma instância é compartilhada entre as sessões do app.
+    """
+
+    def __init__(self, tarefas, sprints_meses):
+        n_meses = len(sprints_meses)
+        self._horas = tarefas["horas"].to_numpy(dtype=np.float64)
+        self._mes = mes_da_sprint(tarefas["sprint"].to_numpy(), sprints_meses)
+        self._empresa = tarefas["empresa"].cat.codes.to_numpy().astype(np.int64)
+        self._status = tarefas["status"].cat.codes.to_numpy().astype(np.int8)
+        self._lock = threading.Lock()
+
+        n_empresas = len(tarefas["empresa"].cat.categories)
+        concluidas = self._status == CONCLUIDA
+        self.planejadas_mes = np.bincount(self._mes, weights=self._horas, minlength=n_meses)
+        self.concluidas_mes = np.bincount(
+            self._mes[concluidas], weights=self._horas[concluidas], minlength=n_meses
+        )
+        self.planejadas_empresa = np.bincount(self._empresa, weights=self._horas, minlength=n_empresas)
+        self.concluidas_empresa = np.bincount(
+            self._empresa[concluidas], weights=self._horas[concluidas], minlength=n_empresas
+        )
+
+    def status(self, linhas):
+        """Status atual (texto) das linhas de `tarefas` indicadas."""
+        with self._lock:
+            codigos = self._status[linhas]
+        return pd.Categorical.from_codes(codigos, categories=STATUS)
+
+    def atualizar_status(self, linha, status):
+        """Muda o status de uma tarefa e ajusta os totais do mês e da empresa
+        dela. Retorna True se o status mudou."""
+        novo = STATUS.index(status)
+        with self._lock:
+            antigo = self._status[linha]
+            if antigo == novo:
+                return False
+            self._status[linha] = novo
+            if (antigo == CONCLUIDA) != (novo == CONCLUIDA):
+                delta = self._horas[linha] if novo == CONCLUIDA else -self._horas[linha]
+                self.concluidas_mes[self._mes[linha]] += delta
+                if self._empresa[linha] >= 0:
+                    self.concluidas_empresa[self._empresa[linha]] += delta
+            return True
+
+    @staticmethod
+    def _percentual(concluidas, planejadas):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(planejadas > 0, concluidas * 100.0 / planejadas, np.nan)
+
+    def totais_meses(self):
+        """Cópias das horas (concluídas, planejadas) de cada mês."""
+        with self._lock:
+            return self.concluidas_mes.copy(), self.planejadas_mes.copy()
+
+    def progresso_meses(self):
+        """Percentual concluído de cada mês (NaN nos meses sem horas planejadas)."""
+        return self._percentual(*self.totais_meses())
+
+    def progresso_empresa(self, codigo):
+        """Percentual concluído e horas (concluídas, planejadas) de uma empresa."""
+        with self._lock:
+            concluidas = self.concluidas_empresa[codigo]
+            planejadas = self.planejadas_empresa[codigo]
+        return float(self._percentual(concluidas, planejadas)), float(concluidas), float(planejadas)
@@ -0,0 +1,91 @@
+"""Índice invertido para busca textual nas tarefas da proposta.
+
+Indexa o texto da tarefa, a pessoa e, no nível da empresa, nome, descrição e
+objetivo; um termo que casa com a empresa seleciona todas as tarefas dela. A
+normalização remove acentos e caixa ("Integração" e "integracao" dão o mesmo
+termo) e cada termo da consulta casa por prefixo. Vários termos são
+combinados com E.
+"""
+import bisect
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+_PALAVRA = re.compile(r"[a-z0-9]+")
+
+
+def normalizar(texto):
+    """Minúsculas e sem acentos."""
+    decomposto = unicodedata.normalize("NFKD", str(texto).lower())
+    return "".join(c for c in decomposto if not unicodedata.combining(c))
+
+
+def tokenizar(texto):
+    return _PALAVRA.findall(normalizar(texto))
+
+
+def _vocabulario(textos):
+    """Mapeia cada termo para o array ordenado das posições em `textos` que o contêm."""
+    posicoes = {}
+    for posicao, texto in enumerate(textos):
+        for termo in set(tokenizar(texto)):
+            posicoes.setdefault(termo, []).append(posicao)
+    termos = sorted(posicoes)
+    return termos, [np.asarray(posicoes[termo], dtype=np.int32) for termo in termos]
+
+
+def _prefixados(termos, listas, prefixo):
+    """Listas de posições de todos os termos que começam com `prefixo`."""
+    inicio = bisect.bisect_left(termos, prefixo)
+    fim = bisect.bisect_left(termos, prefixo + "\uffff")
+    return listas[inicio:fim]
+
+
+class IndiceBusca:
+    """Índice invertido sobre as tabelas `(empresas, tarefas)` de `proposta_dados`."""
+
+    def __init__(self, empresas, tarefas):
+        self._tarefas = tarefas
+        self._codigos_empresa = tarefas["empresa"].cat.codes.to_numpy()
+        self._codigos_pessoa = tarefas["pessoa"].cat.codes.to_numpy()
+
+        # O texto das tarefas se repete muito entre empresas; cada texto
+        # distinto é tokenizado uma vez e depois expandido para as linhas.
+        codigos_texto, textos = pd.factorize(tarefas["tarefa"])
+        ordem = np.argsort(codigos_texto, kind="stable").astype(np.int32)
+        limites = np.searchsorted(codigos_texto[ordem], np.arange(len(textos) + 1))
+        self._termos_tarefa, por_texto = _vocabulario(textos)
+        self._linhas_tarefa = [
+            np.sort(np.concatenate([ordem[limites[t]:limites[t + 1]] for t in textos_termo]))
+            for textos_termo in por_texto
+        ]
+
+        campos_empresa = (
+            empresas.index.astype(str) + " " + empresas["descricao"].astype(str) + " " + empresas["objetivo"].astype(str)
+        )
+        self._termos_empresa, self._empresas = _vocabulario(campos_empresa)
+        self._termos_pessoa, self._pessoas = _vocabulario(tarefas["pessoa"].cat.categories)
+
+    def buscar(self, consulta):
+        """Tarefas que contêm todos os termos da consulta (por prefixo), na
+        ordem da tabela. Retorna uma fatia de `tarefas`, vazia sem termos."""
+        termos = tokenizar(consulta)
+        if not termos:
+            return self._tarefas.iloc[0:0]
+        selecionadas = None
+        for termo in termos:
+            casadas = np.zeros(len(self._tarefas), dtype=bool)
+            for linhas in _prefixados(self._termos_tarefa, self._linhas_tarefa, termo):
+                casadas[linhas] = True
+            empresas = _prefixados(self._termos_empresa, self._empresas, termo)
+            if empresas:
+                casadas |= np.isin(self._codigos_empresa, np.concatenate(empresas))
+            pessoas = _prefixados(self._termos_pessoa, self._pessoas, termo)
+            if pessoas:
+                casadas |= np.isin(self._codigos_pessoa, np.concatenate(pessoas))
+            selecionadas = casadas if selecionadas is None else selecionadas & casadas
+            if not selecionadas.any():
+                break
+        return self._tarefas.iloc[np.flatnonzero(selecionadas)]
@@ -0,0 +1,134 @@
+"""Cache LRU limitado por memória para as propostas carregadas.
+
+Um único `CacheLRU` por processo guarda as propostas interpretadas e as
+tabelas derivadas delas (índice de busca, matrizes de carga, custos...) de
+todas as propostas servidas. Cada entrada tem seu tamanho estimado em bytes
+(`tamanho_em_bytes`) ao ser inserida; quando o total passa do limite, as
+entradas usadas há mais tempo são descartadas. Assim a memória fica presa ao
+limite, e não ao número de propostas do catálogo.
+
+`memorizar` segue a convenção do `st.cache_resource`: parâmetros cujo nome
+começa com `_` não entram na chave.
+"""
+import collections
+import functools
+import inspect
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def tamanho_em_bytes(valor, vistos=None):
+    """Estimativa do tamanho de `valor` em bytes, incluindo o que ele referencia.
+
+    DataFrames e Series contam com `memory_usage(deep=True)` e arrays numpy
+    com `nbytes`; contêineres e objetos comuns são percorridos. Um objeto
+    referenciado por duas entradas do cache conta nas duas, então a
+    estimativa erra para mais.
+    """
+    if vistos is None:
+        vistos = set()
+    if id(valor) in vistos:
+        return 0
+    vistos.add(id(valor))
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(deep=True, index=True).sum())
+    if isinstance(valor, (pd.Series, pd.Index)):
+        return int(valor.memory_usage(deep=True))
+    if isinstance(valor, np.ndarray):
+        return int(valor.nbytes)
+    tamanho = sys.getsizeof(valor)
+    if isinstance(valor, dict):
+        tamanho += sum(tamanho_em_bytes(k, vistos) + tamanho_em_bytes(v, vistos) for k, v in valor.items())
+    elif isinstance(valor, (list, tuple, set, frozenset, collections.deque)):
+        tamanho += sum(tamanho_em_bytes(item, vistos) for item in valor)
+    elif hasattr(valor, "__dict__") and not isinstance(valor, type):
+        tamanho += tamanho_em_bytes(vars(valor), vistos)
+    return tamanho
+
+
+class CacheLRU:
+    """Cache LRU compartilhado entre threads, limitado a `limite_bytes`."""
+
+    def __init__(self, limite_bytes):
+        self.limite_bytes = limite_bytes
+        self._entradas = collections.OrderedDict()  # chave -> (valor, bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._contadores = collections.Counter()
+
+    def obter(self, chave, construir):
+        """Valor de `chave`, construído com `construir()` se não estiver no cache."""
+        with self._lock:
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)
+                self._contadores["acertos"] += 1
+                return self._entradas[chave][0]
+            self._contadores["faltas"] += 1
+
+        # A construção fica fora do lock para não bloquear as outras sessões;
+        # se duas construírem a mesma chave ao mesmo tempo, vale a primeira.
+        inicio = time.perf_counter()
+        valor = construir()
+        duracao = time.perf_counter() - inicio
+        tamanho = tamanho_em_bytes(valor)
+
+        with self._lock:
+            self._contadores["construcao_ms"] += round(duracao * 1000)
+            if chave in self._entradas:
+                return self._entradas[chave][0]
+            if tamanho > self.limite_bytes:
+                # Sozinha já passa do limite: é devolvida sem ficar no cache.
+                self._contadores["recusadas"] += 1
+                return valor
+            self._entradas[chave] = (valor, tamanho)
+            self._bytes += tamanho
+            while self._bytes > self.limite_bytes:
+                _, (_, removidos) = self._entradas.popitem(last=False)
+                self._bytes -= removidos
+                self._contadores["despejos"] += 1
+                self._contadores["bytes_despejados"] += removidos
+            return valor
+
+    def memorizar(self, funcao):
+        """Decorador: guarda o resultado de `funcao` neste cache."""
+        assinatura = inspect.signature(funcao)
+        nome = f"{funcao.__module__}.{funcao.__qualname__}"
+
+        @functools.wraps(funcao)
+        def memorizada(*args, **kwargs):
+            argumentos = assinatura.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            chave = (nome,) + tuple(
+                (parametro, valor) for parametro, valor in argumentos.arguments.items()
+                if not parametro.startswith("_")
+            )
+            return self.obter(chave, lambda: funcao(*args, **kwargs))
+
+        return memorizada
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def metricas(self):
+        """Entradas, bytes ocupados e contadores de acertos, faltas e despejos."""
+        with self._lock:
+            por_funcao = collections.Counter()
+            for chave, (_, tamanho) in self._entradas.items():
+                por_funcao[chave[0].rsplit(".", 1)[-1]] += tamanho
+            return {
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+                "limite_bytes": self.limite_bytes,
+                **{nome: self._contadores[nome] for nome in
+                   ("acertos", "faltas", "despejos", "bytes_despejados", "recusadas", "construcao_ms")},
+                "bytes_por_funcao": dict(por_funcao.most_common()),
+            }
@@ -0,0 +1,284 @@
+"""Conteúdo fixo da proposta e os trechos de HTML compartilhados entre a página
+Streamlit (dashboard_proposta.py) e a exportação estática (exportar_proposta.py).
+"""
+import hashlib
+import html
+import importlib.util
+import itertools
+import os
+import re
+
+# Verifica se o Graphviz está instalado, sem importá-lo
+graphviz_installed = importlib.util.find_spec("graphviz") is not None
+
+# =============================================================================
+# CSS
+# =============================================================================
+CUSTOM_CSS = """
+<style>
+body {
+    font-family: 'Roboto', sans-serif;
+    background-color: #f4f4f8;
+    color: #000000 !important;
+    margin: 0;
+    padding: 0;
+}
+.block-container {
+    background-color: #fff;
+    border-radius: 12px;
+    padding: 2rem 3rem;
+    margin-bottom: 2rem;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.05);
+}
+h1, h2, h3 {
+    color: #283c63;
+}
+h1 {
+    font-size: 2.5rem;
+}
+h2 {
+    font-size: 2rem;
+}
+.stExpander {
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    margin-bottom: 1rem;
+}
+.stProgress > div > div > div > div {
+    background-image: linear-gradient(to right, #4facfe, #00f2fe);
+}
+.sprint-task {
+    background-color: #e9ecef;
+    padding: 0.75rem;
+    border-radius: 6px;
+    margin-bottom: 0.5rem;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+.goal-target {
+    background-color: #f9f9f9;
+    padding: 0.75rem;
+    border-radius: 6px;
+    margin-bottom: 0.5rem;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+.streamlit-expanderHeader {
+    font-size: 1.2rem;
+    color: #3366cc;
+    font-weight: bold;
+}
+.highlight {
+    font-weight: bold;
+    color: #007bff;
+}
+.company-container {
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    padding: 1rem;
+    margin-bottom: 1rem;
+    background-color: #f9f9f9;
+}
+.sprint-details {
+    margin-top: 1rem;
+    padding: 0.5rem;
+    border: 1px solid #eee;
+    border-radius: 4px;
+}
+</style>
+"""
+
+# =============================================================================
+# TEXTOS
+# =============================================================================
+TITULO = "Proposta de Transformação Digital - Scrum"
+SUBTITULO = "Estratégias Personalizadas para Crescimento Acelerado"
+LEGENDAS = [
+    "Liderança: Alberth (Head de Dados, Tecnologia e Marketing com IA)",
+    "Product Owner: Ricardo Menendez Sarmento",
+]
+VISAO_GERAL = """
+Este projeto visa integrar automações, desenvolver sistemas customizados e aplicar análises de dados avançadas para aprimorar o desempenho organizacional.  
+Sob a liderança de **Alberth** e com o gerenciamento do backlog por **Ricardo**, adotaremos a metodologia **Scrum** para garantir entregas de alto valor em sprints de 2 semanas.  
+Cada ciclo contará com Daily Stand-ups, Sprint Reviews e Retrospectivas, assegurando melhoria contínua e adaptação às necessidades dos *stakeholders*.
+"""
+PRODUTIVIDADE = """
+- **Centralização:** Utilização de Jira, Asana ou Notion para gerenciamento de backlogs e sprints.
+- **Alertas e Automação:** Make.com para alertas e relatórios em tempo real.
+- **Reuniões Ágeis:** Daily Stand-ups (15 min) e reuniões estratégicas (30-60 min, 3x por semana).
+- **Base de Conhecimento:** Documentação detalhada e acessível das integrações e processos.
+- **Gestão de Escopo:** Definição clara de limites e reconhecimento das restrições técnicas.
+"""
+FLUXO_INTRODUCAO = """
+Adotamos o framework **Scrum** para estruturar nossos ciclos de entrega em sprints de 2 semanas, garantindo feedback rápido e adaptação contínua. O fluxograma abaixo ilustra o processo:
+"""
+CONSIDERACOES_FINAIS = """
+Esta proposta foi elaborada para transformar digitalmente sua organização, promovendo agilidade, inovação e resultados mensuráveis.  
+Com o uso do **Scrum**, integração de automações e foco em dados, estamos preparados para transformar desafios em oportunidades de crescimento e sucesso.
+"""
+AGRADECIMENTO = "Obrigado por analisar esta proposta. Vamos transformar seus objetivos em realidade!"
+
+
+def markdown_para_html(texto):
+    """Converte o markdown simples dos textos acima (negrito, itálico, listas
+    e quebras de linha) em HTML, para uso fora do Streamlit."""
+    linhas = []
+    for linha in texto.strip().splitlines():
+        linha = html.escape(linha.strip(), quote=False)
+        linha = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", linha)
+        linhas.append(re.sub(r"\*(.+?)\*", r"<em>\1</em>", linha))
+    partes = []
+    for lista, grupo in itertools.groupby(linhas, key=lambda linha: linha.startswith("- ")):
+        grupo = list(grupo)
+        if lista:
+            partes.append("<ul>" + "".join(f"<li>{item[2:]}</li>" for item in grupo) + "</ul>")
+        else:
+            partes.append("<p>" + "<br>\n".join(grupo) + "</p>")
+    return "\n".join(partes)
+
+
+# =============================================================================
+# ROADMAP E SPRINTS
+# =============================================================================
+MODELO_DETALHES_MES = """
+            <div class="goal-target">
+                <strong>Objetivo:</strong> {objetivo}
+            </div>
+            <div class="goal-target">
+                <strong>Meta:</strong> {meta}
+            </div>
+            <p>{descricao}</p>
+            """
+
+MODELO_TAREFA = """
+                    <div class="sprint-task">
+                        <strong>Sprint {sprint}:</strong> {tarefa} <br>
+                        <em>{horas:g} horas</em>
+                    </div>
+                    """
+
+
+def _texto(valor):
+    # Os textos vêm de arquivos da proposta (ou do banco de tarefas) e entram
+    # como texto, não como marcação; aspas não precisam de escape aqui.
+    return html.escape(str(valor), quote=False)
+
+
+def html_detalhes_mes(dados_mes):
+    """Objetivo, meta e descrição de um mês de `roadmap_data`."""
+    return MODELO_DETALHES_MES.format(
+        objetivo=_texto(dados_mes["objetivo"]), meta=_texto(dados_mes["meta"]),
+        descricao=_texto(dados_mes["descricao"]),
+    )
+
+
+def html_tarefas(tarefas_pessoa):
+    """Monta, num único bloco, o HTML `.sprint-task` de todas as tarefas."""
+    return "".join(
+        MODELO_TAREFA.format(sprint=sprint, tarefa=_texto(tarefa), horas=horas)
+        for sprint, tarefa, horas in zip(
+            tarefas_pessoa["sprint"], tarefas_pessoa["tarefa"], tarefas_pessoa["horas"]
+        )
+    )
+
+
+# =============================================================================
+# FLUXO SCRUM
+# =============================================================================
+FLUXO_SCRUM = {
+    "grafo": {"rankdir": "TB"},
+    "no": {"shape": "box", "style": "rounded,filled", "fillcolor": "#DAE8FC", "color": "#6C8EBF",
+           "fontcolor": "#333333", "fontsize": "12", "margin": "0.2,0.1"},
+    "aresta": {"color": "#6C8EBF", "fontcolor": "#333333"},
+    "nos": {
+        "Stakeholder": {"label": "Stakeholder", "fillcolor": "#B9D0EE"},
+        "Client": {"label": "Client Liaison", "fillcolor": "#B9D0EE"},
+        "ProductOwner": {"label": "Product Owner\n(Ricardo)"},
+        "ProductBacklog": {"label": "Product Backlog"},
+        "SprintBacklog": {"label": "Sprint Backlog"},
+        "SprintStart": {"label": "Sprint Start"},
+        "DailyScrum": {"label": "Daily Scrum\n(15 min)"},
+        "SprintReview": {"label": "Sprint Review"},
+        "SprintRetrospective": {"label": "Sprint Retrospective"},
+        "BacklogRefinement": {"label": "Backlog Refinement"},
+        "FinalDelivery": {"label": "Entrega Final", "shape": "doublecircle", "fillcolor": "#90EE90"},
+    },
+    "arestas": [
+        ("Stakeholder", "Client", {}),
+        ("Client", "ProductOwner", {}),
+        ("ProductOwner", "ProductBacklog", {}),
+        ("ProductBacklog", "SprintBacklog", {"label": "Selecionar Itens"}),
+        ("SprintBacklog", "SprintStart", {}),
+        ("SprintStart", "DailyScrum", {}),
+        ("DailyScrum", "SprintReview", {"label": "Fim da Sprint"}),
+        ("SprintReview", "SprintRetrospective", {"label": "Feedback"}),
+        ("SprintRetrospective", "BacklogRefinement", {"label": "Ajustes"}),
+        ("BacklogRefinement", "ProductBacklog", {"label": "Atualização"}),
+        ("SprintReview", "FinalDelivery", {"label": "Lançamento"}),
+    ],
+    "mesmo_nivel": [["SprintReview", "SprintRetrospective"]],
+}
+
+DIRETORIO_CACHE_FLUXOGRAMAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "fluxogramas")
+
+
+def _atributos_dot(atributos):
+    def valor(v):
+        v = str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{v}"'
+    return ", ".join(f"{chave}={valor(v)}" for chave, v in atributos.items())
+
+
+def montar_dot(fluxo):
+    """Gera o código DOT do fluxograma a partir da estrutura de `FLUXO_SCRUM`
+    (ou do `fluxo.json` da proposta, ver `proposta_dados.ler_fluxo`)."""
+    linhas = ["digraph G {"]
+    linhas += [f"    {chave}={v};" for chave, v in fluxo.get("grafo", {}).items()]
+    if fluxo.get("no"):
+        linhas.append(f"    node [{_atributos_dot(fluxo['no'])}];")
+    if fluxo.get("aresta"):
+        linhas.append(f"    edge [{_atributos_dot(fluxo['aresta'])}];")
+    for nome, atributos in fluxo.get("nos", {}).items():
+        linhas.append(f"    {nome} [{_atributos_dot(atributos)}];" if atributos else f"    {nome};")
+    for origem, destino, atributos in fluxo.get("arestas", []):
+        sufixo = f" [{_atributos_dot(atributos)}]" if atributos else ""
+        linhas.append(f"    {origem} -> {destino}{sufixo};")
+    for grupo in fluxo.get("mesmo_nivel", []):
+        linhas.append("    {rank=same; " + "; ".join(grupo) + "}")
+    linhas.append("}")
+    return "\n".join(linhas)
+
+
+def chave_dot(dot):
+    """Hash do código DOT, usado como nome do SVG no cache em disco."""
+    return hashlib.sha256(dot.encode("utf-8")).hexdigest()
+
+
+def renderizar_svg(dot):
+    """SVG do fluxograma descrito por `dot`.
+
+    Procura primeiro no cache em disco, pelo hash do DOT; se não houver,
+    renderiza com o pacote `graphviz` e grava o resultado. Retorna None quando
+    o Graphviz não está disponível.
+    """
+    caminho = os.path.join(DIRETORIO_CACHE_FLUXOGRAMAS, f"{chave_dot(dot)}.svg")
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            return arquivo.read()
+    except OSError:
+        pass
+    if not graphviz_installed:
+        return None
+    import graphviz
+
+    try:
+        svg = graphviz.Source(dot).pipe(format="svg").decode("utf-8")
+    except (graphviz.ExecutableNotFound, graphviz.CalledProcessError):
+        return None
+    try:
+        os.makedirs(DIRETORIO_CACHE_FLUXOGRAMAS, exist_ok=True)
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            arquivo.write(svg)
+        os.replace(temporario, caminho)
+    except OSError:
+        pass
+    return svg
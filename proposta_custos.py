@@ -0,0 +1,150 @@
+"""Modelo de custos das ferramentas e projeção por empresa.
+
+O custo de cada ferramenta chega como texto livre ("A partir de US$10/mês",
+"Gratuito / ChatGPT Plus: US$20/mês"). `tabela_custos` extrai de todas as
+linhas de uma vez (com `str.extract`) o valor, a moeda e o período, e
+converte para reais por mês com uma tabela local de cotações. Custos sem
+preço ou período reconhecível ficam marcados (coluna reconhecido) e fora da
+projeção, em vez de valerem zero.
+
+A projeção (`projetar`) calcula todos os cenários × empresas de uma vez em
+numpy: ferramentas com cobrança fixa somam o mesmo valor para cada empresa,
+e as cobradas por assento multiplicam o valor pelo número de assentos da
+empresa no cenário. Mudar uma cotação ou o número de assentos
+refaz só essas contas, sem reinterpretar os textos.
+"""
+import numpy as np
+import pandas as pd
+
+# Valor de uma unidade de cada moeda em reais; o arquivo `cotacoes.csv` da
+# proposta (ver `proposta_dados`) sobrepõe estes valores.
+COTACOES_PADRAO = {"BRL": 1.0, "USD": 5.0, "EUR": 5.5}
+
+MOEDAS = {"R$": "BRL", "US$": "USD", "U$": "USD", "$": "USD", "€": "EUR", "BRL": "BRL", "USD": "USD", "EUR": "EUR"}
+# Duração de cada período de cobrança, em meses.
+PERIODOS = {
+    "mês": 1, "mes": 1, "m": 1, "mensal": 1, "trimestre": 3, "semestre": 6, "ano": 12, "anual": 12,
+    "month": 1, "mo": 1, "monthly": 1, "quarter": 3, "year": 12, "yr": 12, "yearly": 12, "annual": 12,
+}
+
+# Cenários de assentos: fator aplicado ao tamanho da equipe de cada empresa
+# (pessoas com tarefas nela).
+CENARIOS_ASSENTOS = {"Enxuto": 0.5, "Equipe": 1.0, "Expansão": 2.0}
+
+_PRECO = (
+    r"(?P<simbolo>US\$|U\$|R\$|€|\$|BRL|USD|EUR)\s*(?P<valor>\d[\d.,]*)"
+    r"(?:\s*(?:/|por)\s*(?P<periodo>[a-zçê]+))?"
+)
+
+
+def _numero(textos):
+    """Converte números escritos como "1.200,50", "1,000", "9.99" ou "49" em float.
+
+    O último separador é a vírgula ou o ponto decimal, a não ser que seja o
+    único tipo de separador do número e apareça repetido ou seguido de
+    exatamente três dígitos ("1,000", "1.000.000"): aí separa milhares.
+    """
+    textos = textos.fillna("").str.rstrip(".,")
+    separador = textos.str.extract(r"([.,])(\d*)$")
+    ultimo, casas = separador[0], separador[1].str.len()
+    virgulas, pontos = textos.str.count(","), textos.str.count(r"\.")
+    decimal_virgula = ultimo.eq(",")
+    repeticoes = virgulas.where(decimal_virgula, pontos)
+    outros = pontos.where(decimal_virgula, virgulas)
+    milhar = ultimo.notna() & outros.eq(0) & (casas.eq(3) | repeticoes.gt(1))
+
+    sem_separadores = textos.str.replace(r"[.,]", "", regex=True)
+    com_virgula = textos.str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+    com_ponto = textos.str.replace(",", "", regex=False)
+    normalizados = com_ponto.where(~decimal_virgula, com_virgula).where(~milhar, sem_separadores)
+    return pd.to_numeric(normalizados, errors="coerce")
+
+
+def tabela_custos(ferramentas):
+    """Estrutura os custos de `ferramentas` (lista de dicts ou DataFrame com
+    as colunas Ferramenta, Custo e, opcionalmente, Cobrança).
+
+    Retorna um DataFrame indexado pela ferramenta com valor, moeda, periodo
+    (em meses), mensal (valor por mês na moeda original), gratuito (há plano
+    gratuito), por_assento e reconhecido. Um custo sem preço ou sem período
+    reconhecível fica com valor ou periodo NaN (e mensal NaN) e reconhecido
+    falso; um custo só gratuito, sem preço, vale 0 por mês.
+    """
+    tabela = pd.DataFrame(ferramentas)
+    custo = tabela["Custo"].astype("string").fillna("")
+    preco = custo.str.extract(_PRECO, expand=True)
+    gratuito = custo.str.contains("gratuito|grátis|free", case=False, regex=True).astype(bool)
+    valor = _numero(preco["valor"]).astype(float)
+    periodo = preco["periodo"].str.lower().map(PERIODOS).astype(float)
+    so_gratuito = gratuito & preco["valor"].isna()
+    valor = valor.mask(so_gratuito, 0.0)
+    periodo = periodo.mask(so_gratuito, 1.0)
+    cobranca = tabela["Cobrança"] if "Cobrança" in tabela.columns else pd.Series("fixo", index=tabela.index)
+    return pd.DataFrame(
+        {
+            "valor": valor.to_numpy(float),
+            "moeda": preco["simbolo"].map(MOEDAS).mask(so_gratuito, "BRL").to_numpy(object),
+            "periodo": periodo.to_numpy(float),
+            "mensal": (valor / periodo).to_numpy(float),
+            "gratuito": gratuito.to_numpy(bool),
+            "por_assento": cobranca.astype(str).str.strip().str.lower().eq("assento").to_numpy(bool),
+            "reconhecido": (valor.notna() & periodo.notna()).to_numpy(bool),
+        },
+        index=pd.Index(tabela["Ferramenta"], name="ferramenta"),
+    )
+
+
+def mensal_em_reais(custos, cotacoes=None, usar_gratuito=False):
+    """Custo mensal de cada ferramenta em reais (NaN nos custos não
+    reconhecidos); com `usar_gratuito`, as que têm plano gratuito custam zero."""
+    cotacoes = {**COTACOES_PADRAO, **(cotacoes or {})}
+    taxa = custos["moeda"].map(cotacoes).fillna(1.0).to_numpy(float)
+    mensal = custos["mensal"].to_numpy(float) * taxa
+    if usar_gratuito:
+        mensal = np.where(custos["gratuito"].to_numpy(), 0.0, mensal)
+    return mensal
+
+
+def equipe_por_empresa(empresas, tarefas):
+    """Número de pessoas distintas com tarefas em cada empresa (na ordem de `empresas`)."""
+    n_pessoas = max(len(tarefas["pessoa"].cat.categories), 1)
+    codigos_empresa = tarefas["empresa"].cat.codes.to_numpy().astype(np.int64)
+    codigos_pessoa = tarefas["pessoa"].cat.codes.to_numpy().astype(np.int64)
+    validos = (codigos_empresa >= 0) & (codigos_pessoa >= 0)
+    pares = np.unique(codigos_empresa[validos] * n_pessoas + codigos_pessoa[validos])
+    return np.bincount(pares // n_pessoas, minlength=len(empresas))
+
+
+def projetar(custos, equipe, cotacoes=None, cenarios=CENARIOS_ASSENTOS, assentos_extras=0,
+             usar_gratuito=False):
+    """Custo mensal por cenário × empresa.
+
+    `equipe` tem o tamanho da equipe de cada empresa; no cenário de fator f
+    uma empresa tem ceil(f × equipe) + `assentos_extras` assentos (pelo menos
+    um); toda empresa usa todas as ferramentas. Retorna `(assentos,
+    mensal)`, arrays cenário × empresa, com `mensal` em reais.
+    """
+    # Custos não reconhecidos ficam fora da projeção (o app os aponta).
+    mensal_ferramenta = np.nan_to_num(mensal_em_reais(custos, cotacoes, usar_gratuito))
+    por_assento = custos["por_assento"].to_numpy()
+    fixo = np.where(por_assento, 0.0, mensal_ferramenta)
+    assento = np.where(por_assento, mensal_ferramenta, 0.0)
+
+    fatores = np.fromiter(cenarios.values(), dtype=float)
+    equipe = np.asarray(equipe, dtype=float)
+    assentos = np.maximum(np.ceil(fatores[:, None] * equipe[None, :]) + assentos_extras, 1)
+    mensal = fixo.sum() + assentos * assento.sum()
+    return assentos, mensal
+
+
+def resumo_projecao(empresas, assentos, mensal, meses, cenarios=CENARIOS_ASSENTOS):
+    """Tabela por empresa com assentos, custo mensal e do período em cada
+    cenário, e a linha de total da proposta."""
+    colunas = {}
+    for i, cenario in enumerate(cenarios):
+        colunas[f"{cenario} · assentos"] = assentos[i]
+        colunas[f"{cenario} · mensal (R$)"] = mensal[i]
+        colunas[f"{cenario} · {meses} meses (R$)"] = mensal[i] * meses
+    tabela = pd.DataFrame(colunas, index=pd.Index(empresas, name="empresa"))
+    total = tabela.sum().to_frame("Total da proposta").T
+    return pd.concat([total, tabela])
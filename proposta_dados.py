@@ -0,0 +1,301 @@
+"""Leitura dos dados da proposta a partir de arquivos em disco.
+
+Uma proposta é um diretório com os arquivos abaixo (os formatos de cada grupo
+são alternativos e testados na ordem listada):
+
+- roadmap: `roadmap.json`, no mesmo formato de `roadmap_data`; cada mês pode
+  listar em `sprints` as sprints que cobre (ver
+  `proposta_analise.sprints_dos_meses`);
+- tarefas: `tarefas.parquet` ou `tarefas.csv` (colunas empresa, pessoa, sprint,
+  tarefa, horas e, opcionalmente, status, acompanhadas de `empresas.csv` ou `empresas.json` com
+  descrição e objetivo de cada empresa), `tarefas.sqlite` (um banco SQLite
+  com as tabelas `tarefas` e `empresas`, nas mesmas colunas, por exemplo
+  exportado de um sistema de acompanhamento) ou `companies.json`, no mesmo
+  formato aninhado de `companies`;
+- ferramentas: `ferramentas.csv` ou `ferramentas.json`, com as colunas
+  Ferramenta, Descrição e Custo e, opcionalmente, Cobrança ("assento" para
+  preço por usuário, "fixo" nos demais casos);
+- cotacoes (opcional): `cotacoes.csv`, com as colunas moeda e brl (valor de
+  uma unidade da moeda em reais); ver `proposta_custos.COTACOES_PADRAO`;
+- fluxo (opcional): `fluxo.json`, com o fluxograma de trabalho da proposta
+  na estrutura de `proposta_conteudo.FLUXO_SCRUM` (arestas como listas
+  `[origem, destino]` ou `[origem, destino, {atributos}]`); sem o arquivo,
+  vale o fluxo Scrum padrão.
+
+Várias propostas podem ser servidas a partir de um catálogo (variável
+`PROPOSTA_CATALOGO`): cada subdiretório dele com um `roadmap.json` é uma
+proposta; ver `listar_propostas`.
+
+As funções daqui só interpretam arquivos; o cache entre reruns fica no app,
+chaveado pela `assinatura` (mtime e tamanho) de cada grupo de arquivos.
+"""
+import contextlib
+import importlib.util
+import json
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+# Parquet é opcional: sem o pyarrow, os formatos CSV e JSON continuam valendo.
+# O pyarrow só é importado quando há um arquivo Parquet para ler.
+pyarrow_installed = importlib.util.find_spec("pyarrow") is not None
+
+DIRETORIO_PADRAO = os.environ.get(
+    "PROPOSTA_DADOS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados")
+)
+DIRETORIO_CATALOGO = os.environ.get("PROPOSTA_CATALOGO")
+
+FONTES = {
+    "roadmap": [("roadmap.json",)],
+    "tarefas": [
+        ("tarefas.parquet", "empresas.csv"),
+        ("tarefas.parquet", "empresas.json"),
+        ("tarefas.csv", "empresas.csv"),
+        ("tarefas.csv", "empresas.json"),
+        ("tarefas.sqlite",),
+        ("companies.json",),
+    ],
+    "ferramentas": [("ferramentas.csv",), ("ferramentas.json",)],
+}
+# Grupos que podem faltar: `localizar_fontes` devolve uma tupla vazia.
+FONTES_OPCIONAIS = {
+    "cotacoes": [("cotacoes.csv",)],
+    "fluxo": [("fluxo.json",)],
+}
+
+# Situações possíveis de uma tarefa; sem a informação (ou com um valor
+# desconhecido), a tarefa conta como pendente.
+STATUS = ["pendente", "em andamento", "concluida"]
+
+
+def localizar_fontes(diretorio=DIRETORIO_PADRAO):
+    """Retorna, para cada grupo de `FONTES` e `FONTES_OPCIONAIS`, a tupla de
+    caminhos encontrada."""
+    fontes = {}
+    for grupo, alternativas in {**FONTES, **FONTES_OPCIONAIS}.items():
+        for nomes in alternativas:
+            if nomes[0].endswith(".parquet") and not pyarrow_installed:
+                continue
+            caminhos = tuple(os.path.join(diretorio, nome) for nome in nomes)
+            if all(os.path.isfile(caminho) for caminho in caminhos):
+                fontes[grupo] = caminhos
+                break
+        else:
+            if grupo in FONTES_OPCIONAIS:
+                fontes[grupo] = ()
+                continue
+            raise FileNotFoundError(f"Nenhum arquivo de {grupo} encontrado em {diretorio}.")
+    return fontes
+
+
+def listar_propostas(catalogo=None):
+    """Propostas disponíveis, como dict nome -> diretório, em ordem de nome.
+
+    Sem catálogo, a única proposta é `DIRETORIO_PADRAO`.
+    """
+    if not catalogo:
+        diretorio = DIRETORIO_PADRAO
+        return {os.path.basename(os.path.normpath(diretorio)): diretorio}
+    with os.scandir(catalogo) as entradas:
+        propostas = {
+            entrada.name: entrada.path
+            for entrada in entradas
+            if entrada.is_dir() and os.path.isfile(os.path.join(entrada.path, "roadmap.json"))
+        }
+    if not propostas:
+        raise FileNotFoundError(f"Nenhuma proposta encontrada em {catalogo}.")
+    return dict(sorted(propostas.items()))
+
+
+def assinatura(caminhos):
+    """Identifica a versão de um grupo de arquivos por caminho, mtime e tamanho.
+
+    Num banco SQLite em modo WAL as escritas vão primeiro para o arquivo
+    `-wal`, que também entra na assinatura quando existe.
+    """
+    resultado = []
+    for caminho in caminhos:
+        info = os.stat(caminho)
+        resultado.append((caminho, info.st_mtime_ns, info.st_size))
+        if caminho.endswith(".sqlite") and os.path.isfile(caminho + "-wal"):
+            info = os.stat(caminho + "-wal")
+            resultado.append((caminho + "-wal", info.st_mtime_ns, info.st_size))
+    return tuple(resultado)
+
+
+def _ler_json(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+
+def ler_roadmap(caminhos):
+    return _ler_json(caminhos[0])
+
+
+def ler_ferramentas(caminhos):
+    caminho = caminhos[0]
+    if caminho.endswith(".json"):
+        return _ler_json(caminho)
+    return pd.read_csv(caminho, dtype=str, keep_default_na=False).to_dict("records")
+
+
+def ler_cotacoes(caminhos):
+    """Dict moeda -> valor em reais; vazio quando não há arquivo de cotações."""
+    if not caminhos:
+        return {}
+    cotacoes = pd.read_csv(caminhos[0], dtype={"moeda": str, "brl": float})
+    return dict(zip(cotacoes["moeda"].str.upper(), cotacoes["brl"]))
+
+
+def ler_fluxo(caminhos):
+    """Fluxograma da proposta; None quando não há `fluxo.json` (o chamador
+    usa `proposta_conteudo.FLUXO_SCRUM`)."""
+    if not caminhos:
+        return None
+    fluxo = _ler_json(caminhos[0])
+    fluxo["arestas"] = [
+        (aresta[0], aresta[1], aresta[2] if len(aresta) > 2 else {}) for aresta in fluxo.get("arestas", [])
+    ]
+    return fluxo
+
+
+def ler_tabelas(caminhos):
+    """Lê o grupo de tarefas e devolve `(empresas, tarefas)`; ver `tabelas_de_companies`."""
+    if len(caminhos) == 1 and caminhos[0].endswith(".sqlite"):
+        return _ler_sqlite(caminhos[0])
+    if len(caminhos) == 1:
+        return tabelas_de_companies(_ler_json(caminhos[0]))
+
+    caminho_tarefas, caminho_empresas = caminhos
+    if caminho_empresas.endswith(".json"):
+        empresas = pd.DataFrame(_ler_json(caminho_empresas))
+    else:
+        empresas = pd.read_csv(caminho_empresas, dtype=str, keep_default_na=False)
+    empresas = empresas.set_index("empresa")[["descricao", "objetivo"]]
+
+    if caminho_tarefas.endswith(".parquet"):
+        # Com memory map e strings mantidas em buffers Arrow, as colunas de
+        # texto não viram objetos Python; empresa e pessoa já chegam como
+        # categorias a partir do dicionário do Parquet.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        tabela = pq.read_table(caminho_tarefas, memory_map=True, read_dictionary=["empresa", "pessoa"])
+        tarefas = tabela.to_pandas(
+            split_blocks=True,
+            types_mapper={pa.string(): pd.StringDtype("pyarrow"), pa.large_string(): pd.StringDtype("pyarrow")}.get,
+        )
+    else:
+        tarefas = pd.read_csv(
+            caminho_tarefas,
+            dtype={"empresa": "category", "pessoa": "category", "sprint": "int16",
+                   "tarefa": "string", "horas": "float32", "status": "string"},
+        )
+    return _normalizar(empresas, tarefas)
+
+
+def _ler_sqlite(caminho):
+    # Somente leitura: o banco pertence a quem o atualiza.
+    with contextlib.closing(sqlite3.connect(f"file:{caminho}?mode=ro", uri=True)) as conexao:
+        empresas = pd.read_sql_query("SELECT empresa, descricao, objetivo FROM empresas", conexao)
+        tarefas = pd.read_sql_query("SELECT * FROM tarefas", conexao)
+    tarefas = tarefas.astype({"tarefa": "string"})
+    return _normalizar(empresas.set_index("empresa"), tarefas)
+
+
+def tabelas_de_companies(companies):
+    """Normaliza `companies` em duas tabelas colunares.
+
+    Retorna `(empresas, tarefas)`: `empresas` é indexada pelo nome da empresa
+    (descrição, objetivo e o intervalo `inicio:fim` de suas linhas em
+    `tarefas`) e `tarefas` tem uma linha por tarefa com as colunas empresa,
+    pessoa, sprint, tarefa, horas e status. Empresa e pessoa são categóricas,
+    na ordem em que aparecem nos dados; status é categórica com as categorias
+    de `STATUS`.
+    """
+    nomes_empresas = list(companies.keys())
+    empresas = pd.DataFrame(
+        {
+            "descricao": [d["description"] for d in companies.values()],
+            "objetivo": [d["objective"] for d in companies.values()],
+        },
+        index=pd.Index(nomes_empresas, name="empresa"),
+    )
+
+    col_empresa, col_pessoa, col_sprint, col_tarefa, col_horas, col_status = [], [], [], [], [], []
+    pessoas = {}
+    for empresa, details in companies.items():
+        for pessoa, tarefas_pessoa in details["sprints"].items():
+            pessoas.setdefault(pessoa, None)
+            n = len(tarefas_pessoa)
+            col_empresa.extend([empresa] * n)
+            col_pessoa.extend([pessoa] * n)
+            for sprint_data in tarefas_pessoa:
+                col_sprint.append(sprint_data["sprint"])
+                col_tarefa.append(sprint_data["task"])
+                col_horas.append(sprint_data["hours"])
+                col_status.append(sprint_data.get("status", STATUS[0]))
+
+    tarefas = pd.DataFrame(
+        {
+            "empresa": pd.Categorical(col_empresa, categories=nomes_empresas),
+            "pessoa": pd.Categorical(col_pessoa, categories=list(pessoas)),
+            "sprint": pd.array(col_sprint, dtype="int16"),
+            "tarefa": pd.array(col_tarefa, dtype="string"),
+            "horas": pd.array(col_horas, dtype="float32"),
+            "status": col_status,
+        }
+    )
+    return _normalizar(empresas, tarefas)
+
+
+def _normalizar(empresas, tarefas):
+    """Garante os tipos das colunas, agrupa as linhas por empresa (na ordem de
+    `empresas`) e preenche o intervalo `inicio:fim` de cada empresa."""
+    empresas = empresas.copy()
+    if "status" not in tarefas.columns:
+        tarefas = tarefas.assign(status=STATUS[0])
+    tarefas = tarefas[["empresa", "pessoa", "sprint", "tarefa", "horas", "status"]]
+    nomes_empresas = list(empresas.index)
+    empresa = tarefas["empresa"]
+    # Uma tarefa de empresa não declarada viraria uma linha sem empresa (NaN);
+    # é um erro nos arquivos da proposta e é apontado como tal.
+    if isinstance(empresa.dtype, pd.CategoricalDtype):
+        usadas = empresa.cat.remove_unused_categories().cat.categories
+    else:
+        usadas = pd.unique(empresa.dropna())
+    nao_declaradas = sorted(set(map(str, usadas)) - set(nomes_empresas))
+    if nao_declaradas or empresa.isna().any():
+        detalhes = [f"empresas não declaradas: {', '.join(nao_declaradas)}"] if nao_declaradas else []
+        if empresa.isna().any():
+            detalhes.append(f"{int(empresa.isna().sum())} tarefa(s) sem empresa")
+        raise ValueError("Tarefas sem empresa correspondente na proposta (" + "; ".join(detalhes) + ").")
+    if not isinstance(empresa.dtype, pd.CategoricalDtype):
+        empresa = pd.Categorical(empresa, categories=nomes_empresas)
+    elif list(empresa.cat.categories) != nomes_empresas:
+        empresa = empresa.cat.set_categories(nomes_empresas)
+    pessoa = tarefas["pessoa"]
+    if not isinstance(pessoa.dtype, pd.CategoricalDtype):
+        pessoa = pd.Categorical(pessoa, categories=pd.unique(pessoa))
+    tarefas = tarefas.assign(
+        empresa=empresa,
+        pessoa=pessoa,
+        sprint=tarefas["sprint"].astype("int16"),
+        horas=tarefas["horas"].astype("float32"),
+        status=pd.Categorical(tarefas["status"].astype("string"), categories=STATUS).fillna(STATUS[0]),
+    )
+
+    # As linhas de cada empresa ficam contíguas, então o intervalo de cada uma
+    # sai de uma busca binária sobre os códigos da categoria.
+    codigos = tarefas["empresa"].cat.codes.to_numpy()
+    if len(codigos) and (np.diff(codigos) < 0).any():
+        ordem = np.argsort(codigos, kind="stable")
+        tarefas = tarefas.iloc[ordem]
+        codigos = codigos[ordem]
+    tarefas = tarefas.reset_index(drop=True)
+    posicoes = np.arange(len(nomes_empresas))
+    empresas["inicio"] = np.searchsorted(codigos, posicoes, side="left")
+    empresas["fim"] = np.searchsorted(codigos, posicoes, side="right")
+    return empresas, tarefas
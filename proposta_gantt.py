@@ -0,0 +1,123 @@
+"""Linha do tempo (Gantt) das sprints com Plotly.
+
+A visão geral usa as matrizes de horas por sprint de `proposta_analise`
+(uma barra por linha × sprint, só para as linhas com mais horas), então o
+número de pontos enviados ao navegador não depende do número de tarefas. O
+detalhe por tarefa é montado só para a empresa escolhida e também é limitado.
+Acima de `LIMITE_WEBGL` barras, os traços passam a ser `Scattergl` (WebGL).
+
+O eixo x é contado em sprints: a sprint `s` ocupa o intervalo [s - 1, s].
+Os meses do roadmap (`meses`, dict mês -> sprints de
+`proposta_analise.sprints_dos_meses`) aparecem como faixas ao fundo.
+"""
+import numpy as np
+
+LIMITE_WEBGL = 500
+FAIXAS_COR = ["#c6dbef", "#9ecae1", "#6baed6", "#3182bd", "#08519c"]
+
+
+def _faixas(valores):
+    """Índice da faixa de cor (0 a len(FAIXAS_COR) - 1) de cada valor."""
+    maximo = valores.max() if len(valores) else 0
+    if maximo <= 0:
+        return np.zeros(len(valores), dtype=int)
+    return np.minimum((valores / maximo * len(FAIXAS_COR)).astype(int), len(FAIXAS_COR) - 1)
+
+
+def _adicionar_barras(fig, linhas, inicios, fins, horas, textos, webgl):
+    import plotly.graph_objs as go
+
+    faixas = _faixas(horas)
+    for faixa, cor in enumerate(FAIXAS_COR):
+        selecao = faixas == faixa
+        if not selecao.any():
+            continue
+        if webgl:
+            # Cada barra vira um segmento grosso; `None` separa os segmentos
+            # dentro do mesmo traço.
+            n = int(selecao.sum())
+            x = np.empty(n * 3, dtype=object)
+            x[0::3] = inicios[selecao]
+            x[1::3] = fins[selecao]
+            x[2::3] = None
+            y = np.repeat(linhas[selecao], 3).astype(object)
+            y[2::3] = None
+            texto = np.repeat(textos[selecao], 3).astype(object)
+            fig.add_trace(go.Scattergl(
+                x=x, y=y, mode="lines", line=dict(color=cor, width=12), text=texto,
+                hoverinfo="text", showlegend=False,
+            ))
+        else:
+            fig.add_trace(go.Bar(
+                x=fins[selecao] - inicios[selecao], base=inicios[selecao], y=linhas[selecao],
+                orientation="h", marker_color=cor, hovertext=textos[selecao], hoverinfo="text",
+                showlegend=False,
+            ))
+
+
+def _layout(fig, meses, n_sprints, n_linhas):
+    ultima_sprint = 0
+    for i, (mes, sprints) in enumerate(meses.items()):
+        if not sprints:
+            continue
+        ultima_sprint = max(ultima_sprint, max(sprints))
+        fig.add_vrect(
+            x0=min(sprints) - 1, x1=max(sprints), fillcolor="#283c63", opacity=0.04 if i % 2 else 0.08,
+            line_width=0, annotation_text=mes, annotation_position="top left",
+        )
+    fig.update_layout(
+        barmode="overlay",
+        height=max(300, min(1200, 28 * n_linhas + 80)),
+        margin=dict(l=10, r=10, t=30, b=10),
+        xaxis=dict(title="Sprint", range=[0, max(n_sprints, ultima_sprint)],
+                   tickmode="array", tickvals=np.arange(n_sprints) + 0.5,
+                   ticktext=[str(s) for s in range(1, n_sprints + 1)]),
+        yaxis=dict(autorange="reversed", type="category"),
+    )
+    return fig
+
+
+def figura_agregada(matriz, meses, max_linhas=40):
+    """Barras por linha × sprint a partir de uma matriz de horas de
+    `proposta_analise.agregar_carga`, limitada às `max_linhas` linhas com
+    mais horas. Retorna a figura e o número de barras."""
+    import plotly.graph_objs as go
+
+    principais = matriz.loc[matriz.sum(axis=1).nlargest(max_linhas).index]
+    valores = principais.to_numpy()
+    linha_idx, sprint_idx = np.nonzero(valores)
+    linhas = principais.index.astype(str).to_numpy()[linha_idx]
+    sprints = principais.columns.to_numpy()[sprint_idx].astype(float)
+    horas = valores[linha_idx, sprint_idx]
+    textos = np.array([f"{l} · Sprint {int(s)}: {h:g} horas" for l, s, h in zip(linhas, sprints, horas)], dtype=object)
+
+    fig = go.Figure()
+    _adicionar_barras(fig, linhas, sprints - 1, sprints, horas, textos, webgl=len(horas) > LIMITE_WEBGL)
+    n_sprints = int(matriz.columns.max()) if len(matriz.columns) else 0
+    return _layout(fig, meses, n_sprints, len(principais)), len(horas)
+
+
+def figura_detalhada(tarefas_empresa, meses, max_tarefas=1000):
+    """Uma barra por tarefa (linha = pessoa) da empresa, limitada às
+    `max_tarefas` primeiras. Tarefas da mesma pessoa na mesma sprint dividem
+    o intervalo da sprint. Retorna a figura e o número de barras."""
+    import plotly.graph_objs as go
+
+    tarefas = tarefas_empresa.iloc[:max_tarefas]
+    linhas = tarefas["pessoa"].astype(str).to_numpy()
+    sprints = tarefas["sprint"].to_numpy().astype(float)
+    horas = tarefas["horas"].to_numpy().astype(float)
+    chave = [tarefas["pessoa"], tarefas["sprint"]]
+    posicao = tarefas.groupby(chave, observed=True).cumcount().to_numpy()
+    divisoes = tarefas.groupby(chave, observed=True)["sprint"].transform("size").to_numpy()
+    inicios = sprints - 1 + posicao / divisoes
+    fins = inicios + 0.9 / divisoes
+    textos = np.array(
+        [f"{p} · Sprint {int(s)}: {t} ({h:g} horas)" for p, s, t, h in zip(linhas, sprints, tarefas["tarefa"], horas)],
+        dtype=object,
+    )
+
+    fig = go.Figure()
+    _adicionar_barras(fig, linhas, inicios, fins, horas, textos, webgl=len(tarefas) > LIMITE_WEBGL)
+    n_sprints = int(tarefas_empresa["sprint"].max()) if len(tarefas_empresa) else 0
+    return _layout(fig, meses, n_sprints, len(np.unique(linhas))), len(tarefas)
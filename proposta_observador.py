@@ -0,0 +1,165 @@
+"""Observação dos dados de uma proposta em segundo plano.
+
+Um `Observador` por proposta (compartilhado por todas as sessões que a
+exibem) confere periodicamente, numa thread própria, a assinatura dos
+arquivos de roadmap e tarefas. Quando ela muda, os dados são relidos e
+comparados com o estado anterior: `diferenca_empresas` aponta as empresas cujo
+cartão mudou e `diferenca_roadmap` os meses cuja coluna do roadmap mudou
+(texto ou horas planejadas/concluídas). Cada mudança ganha um número de
+versão e fica num histórico curto, do qual cada sessão pede só o que mudou
+desde a última versão que ela exibiu (`alteracoes_desde`).
+
+A thread para sozinha depois de `OCIOSIDADE` segundos sem nenhuma sessão
+consultando o observador e volta na consulta seguinte; o app descarta os
+observadores parados (`ocioso`).
+"""
+import collections
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import proposta_analise
+import proposta_dados
+
+OCIOSIDADE = 600
+
+
+def impressoes_empresas(empresas, tarefas):
+    """Dict empresa -> hash do conteúdo do cartão (descrição, objetivo e
+    tarefas, na ordem da tabela)."""
+    colunas = tarefas[["pessoa", "sprint", "tarefa", "horas", "status"]]
+    linhas = pd.util.hash_pandas_object(colunas, index=False).to_numpy()
+    cabecalhos = pd.util.hash_pandas_object(empresas[["descricao", "objetivo"]], index=False).to_numpy()
+    return {
+        empresa: hash((int(cabecalho), linhas[inicio:fim].tobytes()))
+        for empresa, cabecalho, inicio, fim in zip(
+            empresas.index, cabecalhos, empresas["inicio"].to_numpy(), empresas["fim"].to_numpy()
+        )
+    }
+
+
+def diferenca_empresas(anteriores, atuais):
+    """Empresas incluídas, removidas ou alteradas entre dois dicts de
+    `impressoes_empresas`."""
+    alteradas = {empresa for empresa, impressao in atuais.items() if anteriores.get(empresa) != impressao}
+    return alteradas | (anteriores.keys() - atuais.keys())
+
+
+def totais_roadmap(roadmap_data, tarefas):
+    """Horas (concluídas, planejadas) de cada mês do roadmap."""
+    sprints_meses = proposta_analise.sprints_dos_meses(roadmap_data)
+    return proposta_analise.ProgressoRoadmap(tarefas, list(sprints_meses.values())).totais_meses()
+
+
+def diferenca_roadmap(roadmap_anterior, totais_anteriores, roadmap_atual, totais_atuais):
+    """Meses cujo texto ou horas concluídas/planejadas mudaram."""
+    alterados = set(roadmap_anterior.keys() ^ roadmap_atual.keys())
+    posicoes = {mes: j for j, mes in enumerate(roadmap_anterior)}
+    for i, mes in enumerate(roadmap_atual):
+        if mes in alterados:
+            continue
+        j = posicoes[mes]
+        if (
+            roadmap_anterior[mes] != roadmap_atual[mes]
+            or j != i
+            or not all(np.isclose(anterior[j], atual[i]) for anterior, atual in zip(totais_anteriores, totais_atuais))
+        ):
+            alterados.add(mes)
+    return alterados
+
+
+class Observador:
+    """Acompanha os dados de roadmap e tarefas do `diretorio` de uma proposta.
+
+    `carregar_roadmap(versao, caminhos)` e `carregar_tabelas(versao,
+    caminhos)` leem os dados; o app passa os carregadores em cache, então o que
+    o observador relê já fica disponível para as sessões.
+    """
+
+    def __init__(self, diretorio, carregar_roadmap, carregar_tabelas, intervalo=2.0, historico=256):
+        self.diretorio = diretorio
+        self.intervalo = intervalo
+        self._carregar_roadmap = carregar_roadmap
+        self._carregar_tabelas = carregar_tabelas
+        self._lock = threading.Lock()
+        self._alteracoes = collections.deque(maxlen=historico)  # (versao, empresas, meses, estrutura)
+        self.versao = 0
+        self.ultimo_erro = None
+        self._estado = self._ler()
+        self._ultima_consulta = time.monotonic()
+        self._thread = None
+
+    def _ler(self):
+        fontes = proposta_dados.localizar_fontes(self.diretorio)
+        versoes = (proposta_dados.assinatura(fontes["roadmap"]), proposta_dados.assinatura(fontes["tarefas"]))
+        roadmap_data = self._carregar_roadmap(versoes[0], fontes["roadmap"])
+        empresas, tarefas = self._carregar_tabelas(versoes[1], fontes["tarefas"])
+        return {
+            "versoes": versoes,
+            "roadmap": roadmap_data,
+            "impressoes": impressoes_empresas(empresas, tarefas),
+            "totais": totais_roadmap(roadmap_data, tarefas),
+        }
+
+    def verificar(self):
+        """Confere os arquivos e, se mudaram, registra uma nova versão.
+        Retorna True quando houve mudança."""
+        fontes = proposta_dados.localizar_fontes(self.diretorio)
+        versoes = (proposta_dados.assinatura(fontes["roadmap"]), proposta_dados.assinatura(fontes["tarefas"]))
+        if versoes == self._estado["versoes"]:
+            return False
+        anterior, atual = self._estado, self._ler()
+        empresas = diferenca_empresas(anterior["impressoes"], atual["impressoes"])
+        meses = diferenca_roadmap(anterior["roadmap"], anterior["totais"], atual["roadmap"], atual["totais"])
+        estrutura = anterior["impressoes"].keys() != atual["impressoes"].keys()
+        with self._lock:
+            self._estado = atual
+            self.versao += 1
+            self._alteracoes.append((self.versao, empresas, meses, estrutura))
+        return True
+
+    def _executar(self):
+        while time.monotonic() - self._ultima_consulta < OCIOSIDADE:
+            time.sleep(self.intervalo)
+            try:
+                self.verificar()
+                self.ultimo_erro = None
+            except Exception as erro:
+                # Arquivos em meio a uma gravação: a próxima verificação tenta de novo.
+                self.ultimo_erro = repr(erro)
+
+    def _garantir_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._executar, name=f"observador {self.diretorio}", daemon=True
+            )
+            self._thread.start()
+
+    def ocioso(self):
+        """Verdadeiro quando a thread parou por falta de consultas."""
+        with self._lock:
+            parado = self._thread is None or not self._thread.is_alive()
+            return parado and time.monotonic() - self._ultima_consulta >= OCIOSIDADE
+
+    def alteracoes_desde(self, versao):
+        """O que mudou depois de `versao`: `(versao_atual, empresas, meses,
+        estrutura)`, com os conjuntos de empresas e meses alterados e
+        `estrutura` verdadeiro se empresas foram incluídas ou removidas. Se o
+        histórico já não cobre `versao` (ou ela é de outro observador da
+        mesma proposta), empresas e meses vêm como None (tudo pode ter
+        mudado)."""
+        with self._lock:
+            self._ultima_consulta = time.monotonic()
+            self._garantir_thread()
+            atual = self.versao
+            pendentes = [alteracao for alteracao in self._alteracoes if alteracao[0] > versao]
+        if versao > atual or len(pendentes) < atual - versao:
+            return atual, None, None, True
+        empresas, meses, estrutura = set(), set(), False
+        for _, empresas_versao, meses_versao, estrutura_versao in pendentes:
+            empresas |= empresas_versao
+            meses |= meses_versao
+            estrutura = estrutura or estrutura_versao
+        return atual, empresas, meses, estrutura
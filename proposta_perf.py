@@ -0,0 +1,137 @@
+"""Medição do tempo de cada seção da página a cada execução do script.
+
+O `Cronometro` é criado no início da execução e marcado no começo de cada
+seção; cada marca fecha a seção anterior e grava tempo e número de elementos
+emitidos no `RegistroDesempenho`, um buffer circular compartilhado entre as
+sessões. Com a medição desligada o app usa `CRONOMETRO_INATIVO`, cujas marcas
+não fazem nada.
+"""
+import collections
+import itertools
+import json
+import threading
+import time
+
+import pandas as pd
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:
+    get_script_run_ctx = None
+
+
+def remover_contador(ctx=None):
+    """Desfaz a contagem de elementos que tenha sobrado de uma execução
+    interrompida (por `st.rerun` ou `st.stop`, que pulam `finalizar`). O app
+    chama a cada execução, com a medição ligada ou não."""
+    if ctx is None and get_script_run_ctx is not None:
+        ctx = get_script_run_ctx()
+    if ctx is not None:
+        ctx.__dict__.pop("enqueue", None)
+
+
+class RegistroDesempenho:
+    """Buffer circular, seguro entre threads, com as medições mais recentes."""
+
+    def __init__(self, capacidade=5000):
+        self._medicoes = collections.deque(maxlen=capacidade)
+        self._lock = threading.Lock()
+        self._execucoes = itertools.count(1)
+
+    def nova_execucao(self):
+        return next(self._execucoes)
+
+    def registrar(self, medicao):
+        with self._lock:
+            self._medicoes.append(medicao)
+
+    def medicoes(self):
+        with self._lock:
+            return list(self._medicoes)
+
+    def __len__(self):
+        return len(self._medicoes)
+
+    def resumo(self):
+        """p50/p95 do tempo (ms) e média de elementos por seção."""
+        medicoes = pd.DataFrame(self.medicoes())
+        if medicoes.empty:
+            return medicoes
+        por_secao = medicoes.groupby("secao", sort=False)
+        return pd.DataFrame({
+            "execuções": por_secao.size(),
+            "p50 (ms)": por_secao["duracao_ms"].quantile(0.5),
+            "p95 (ms)": por_secao["duracao_ms"].quantile(0.95),
+            "elementos": por_secao["elementos"].mean(),
+        }).round(1)
+
+    def jsonl(self):
+        """Medições em JSON lines, uma por seção e execução."""
+        return "".join(json.dumps(m, ensure_ascii=False) + "\n" for m in self.medicoes())
+
+
+class Cronometro:
+    """Mede as seções de uma execução do script e grava no `registro`.
+
+    Os elementos são contados interceptando o envio de mensagens da sessão
+    (`ScriptRunContext.enqueue`) enquanto a execução é medida; fora do
+    Streamlit a contagem fica como None.
+    """
+
+    def __init__(self, registro, secao, inicio=None, arquivo_log=None):
+        self._registro = registro
+        self._arquivo_log = arquivo_log
+        self._execucao = registro.nova_execucao()
+        self._secao = secao
+        self._inicio = inicio if inicio is not None else time.perf_counter()
+        self._elementos = 0
+        self._linhas_log = []
+        self._ctx = get_script_run_ctx() if get_script_run_ctx else None
+        if self._ctx is not None:
+            remover_contador(self._ctx)
+            enviar = self._ctx.enqueue
+
+            def enqueue(msg):
+                if msg.WhichOneof("type") == "delta":
+                    self._elementos += 1
+                enviar(msg)
+
+            self._ctx.enqueue = enqueue
+
+    def secao(self, nome):
+        """Fecha a seção corrente (se houver) e começa a medir `nome`."""
+        agora = time.perf_counter()
+        if self._secao is not None:
+            medicao = {
+                "ts": round(time.time(), 3),
+                "execucao": self._execucao,
+                "secao": self._secao,
+                "duracao_ms": round((agora - self._inicio) * 1000, 3),
+                "elementos": self._elementos if self._ctx is not None else None,
+            }
+            self._registro.registrar(medicao)
+            if self._arquivo_log:
+                self._linhas_log.append(json.dumps(medicao, ensure_ascii=False) + "\n")
+        self._secao = nome
+        self._inicio = agora
+        self._elementos = 0
+
+    def finalizar(self):
+        """Fecha a última seção, desfaz a contagem e grava o log, se houver."""
+        self.secao(None)
+        if self._ctx is not None:
+            remover_contador(self._ctx)
+        if self._linhas_log:
+            with open(self._arquivo_log, "a", encoding="utf-8") as arquivo:
+                arquivo.writelines(self._linhas_log)
+
+
+class _CronometroInativo:
+    def secao(self, nome):
+        pass
+
+    def finalizar(self):
+        pass
+
+
+CRONOMETRO_INATIVO = _CronometroInativo()
@@ -0,0 +1,43 @@
+import os
+import sys
+
+# Os módulos do app ficam na raiz do repositório, fora de um pacote.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import proposta_dados
+
+
+@pytest.fixture
+def tabelas():
+    """`(empresas, tarefas)` de uma proposta pequena, com status variados."""
+    companies = {
+        "Alfa Integrações": {
+            "description": "Automação de pedidos.",
+            "objective": "Integração de API e funil de vendas.",
+            "sprints": {
+                "Ana": [
+                    {"sprint": 1, "task": "Criar endpoints de integração", "hours": 20, "status": "concluida"},
+                    {"sprint": 2, "task": "Funil de vendas no WhatsApp", "hours": 15, "status": "em andamento"},
+                ],
+                "Bruno": [
+                    {"sprint": 3, "task": "Testes de carga", "hours": 10},
+                ],
+            },
+        },
+        "Beta Análises": {
+            "description": "Painéis de indicadores.",
+            "objective": "Relatórios automáticos.",
+            "sprints": {
+                "Bruno": [
+                    {"sprint": 1, "task": "Coletar dados", "hours": 8, "status": "concluida"},
+                    {"sprint": 4, "task": "Análise preditiva", "hours": 12},
+                ],
+                "Carla": [
+                    {"sprint": 2, "task": "Painel de integração", "hours": 5, "status": "concluida"},
+                ],
+            },
+        },
+    }
+    return proposta_dados.tabelas_de_companies(companies)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import proposta_analise
+from proposta_dados import STATUS
+
+
+def test_sprints_dos_meses_usa_a_lista_do_roadmap_ou_a_posicao():
+    roadmap = {"Mês 1": {"sprints": [1]}, "Mês 2": {}, "Mês 3": {"sprints": [5, 6]}}
+    assert proposta_analise.sprints_dos_meses(roadmap) == {"Mês 1": (1,), "Mês 2": (3, 4), "Mês 3": (5, 6)}
+
+
+def test_sprints_dos_meses_rejeita_sprint_repetida():
+    with pytest.raises(ValueError, match="Sprint 2"):
+        proposta_analise.sprints_dos_meses({"Mês 1": {"sprints": [1, 2]}, "Mês 2": {"sprints": [2]}})
+
+
+def test_mes_da_sprint_fora_dos_meses_conta_na_anterior():
+    meses = proposta_analise.mes_da_sprint([0, 1, 2, 3, 4, 5, 9], [(1, 2), (4,), (5,)])
+    np.testing.assert_array_equal(meses, [0, 0, 0, 0, 1, 2, 2])
+
+
+def test_agregar_carga_por_pessoa_e_empresa(tabelas):
+    _, tarefas = tabelas
+    carga = proposta_analise.agregar_carga(tarefas)
+    assert carga["pessoa"].loc["Bruno"].tolist() == [8, 0, 10, 12]
+    assert carga["empresa"].sum(axis=1).tolist() == [45, 25]
+
+
+def _recalculado(tarefas, status, sprints_meses):
+    """Totais somados do zero, com os status indicados."""
+    return proposta_analise.ProgressoRoadmap(tarefas.assign(status=status), sprints_meses)
+
+
+def test_progresso_roadmap(tabelas):
+    _, tarefas = tabelas
+    progresso = proposta_analise.ProgressoRoadmap(tarefas, [(1,), (2,), (3, 4)])
+    concluidas, planejadas = progresso.totais_meses()
+    np.testing.assert_allclose(planejadas, [28, 20, 22])
+    np.testing.assert_allclose(concluidas, [28, 5, 0])
+    assert progresso.progresso_empresa(0) == pytest.approx((20 / 45 * 100, 20, 45))
+
+
+def test_atualizar_status_igual_ao_recalculo(tabelas):
+    _, tarefas = tabelas
+    sprints_meses = [(1,), (2,), (3, 4)]
+    progresso = proposta_analise.ProgressoRoadmap(tarefas, sprints_meses)
+    status = tarefas["status"].copy()
+    aleatorio = np.random.default_rng(0)
+    for _ in range(50):
+        linha = int(aleatorio.integers(len(tarefas)))
+        novo = STATUS[aleatorio.integers(len(STATUS))]
+        assert progresso.atualizar_status(linha, novo) == (status.iloc[linha] != novo)
+        status.iloc[linha] = novo
+
+        esperado = _recalculado(tarefas, status, sprints_meses)
+        for atual, total in zip(progresso.totais_meses(), esperado.totais_meses()):
+            np.testing.assert_allclose(atual, total)
+        np.testing.assert_allclose(progresso.concluidas_empresa, esperado.concluidas_empresa)
+    assert progresso.status(np.arange(len(tarefas))).tolist() == status.tolist()
@@ -0,0 +1,34 @@
+import proposta_busca
+
+
+def test_normalizar_e_tokenizar():
+    assert proposta_busca.normalizar("Integração") == "integracao"
+    assert proposta_busca.tokenizar("Funil de vendas, WhatsApp!") == ["funil", "de", "vendas", "whatsapp"]
+
+
+def test_busca_por_prefixo_sem_acento(tabelas):
+    empresas, tarefas = tabelas
+    indice = proposta_busca.IndiceBusca(empresas, tarefas)
+    assert indice.buscar("painel integrac")["tarefa"].tolist() == ["Painel de integração"]
+    assert indice.buscar("ENDPOINT")["tarefa"].tolist() == ["Criar endpoints de integração"]
+
+
+def test_termo_da_empresa_seleciona_todas_as_tarefas_dela(tabelas):
+    empresas, tarefas = tabelas
+    resultado = proposta_busca.IndiceBusca(empresas, tarefas).buscar("relatórios")
+    assert set(resultado["empresa"]) == {"Beta Análises"}
+    assert len(resultado) == 3
+
+
+def test_termos_combinados_com_e(tabelas):
+    empresas, tarefas = tabelas
+    indice = proposta_busca.IndiceBusca(empresas, tarefas)
+    assert indice.buscar("bruno testes")["tarefa"].tolist() == ["Testes de carga"]
+    assert indice.buscar("carla testes").empty
+
+
+def test_consulta_sem_termos_devolve_fatia_vazia(tabelas):
+    empresas, tarefas = tabelas
+    resultado = proposta_busca.IndiceBusca(empresas, tarefas).buscar(" ,. ")
+    assert resultado.empty
+    assert list(resultado.columns) == list(tarefas.columns)
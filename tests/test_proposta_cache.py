@@ -0,0 +1,64 @@
+import numpy as np
+
+import proposta_cache
+
+
+def _array(n_bytes):
+    return np.zeros(n_bytes, dtype=np.uint8)
+
+
+def test_tamanho_em_bytes_de_arrays_e_conteineres():
+    assert proposta_cache.tamanho_em_bytes(_array(1000)) == 1000
+    compartilhado = _array(500)
+    # Um objeto referenciado duas vezes no mesmo valor conta uma vez só.
+    assert proposta_cache.tamanho_em_bytes([compartilhado, compartilhado]) < 1000
+
+
+def test_despeja_as_entradas_usadas_ha_mais_tempo():
+    cache = proposta_cache.CacheLRU(2500)
+    cache.obter("a", lambda: _array(1000))
+    cache.obter("b", lambda: _array(1000))
+    cache.obter("a", lambda: _array(1000))  # "a" passa a ser a mais recente
+    cache.obter("c", lambda: _array(1000))
+
+    metricas = cache.metricas()
+    assert len(cache) == 2
+    assert metricas["bytes"] == 2000
+    assert metricas["despejos"] == 1
+    assert metricas["bytes_despejados"] == 1000
+    assert (metricas["acertos"], metricas["faltas"]) == (1, 3)
+    reconstruidas = []
+    cache.obter("b", lambda: reconstruidas.append("b") or _array(1000))
+    assert reconstruidas == ["b"]
+
+
+def test_entrada_maior_que_o_limite_nao_fica_no_cache():
+    cache = proposta_cache.CacheLRU(100)
+    valor = cache.obter("grande", lambda: _array(1000))
+    assert len(valor) == 1000
+    assert len(cache) == 0
+    assert cache.metricas()["recusadas"] == 1
+
+
+def test_limpar_zera_os_bytes():
+    cache = proposta_cache.CacheLRU(10_000)
+    cache.obter("a", lambda: _array(1000))
+    cache.limpar()
+    assert len(cache) == 0
+    assert cache.metricas()["bytes"] == 0
+
+
+def test_memorizar_ignora_parametros_com_sublinhado():
+    cache = proposta_cache.CacheLRU(10_000)
+    chamadas = []
+
+    @cache.memorizar
+    def carregar(versao, _dados):
+        chamadas.append(versao)
+        return _array(10)
+
+    primeiro = carregar(1, "x")
+    assert carregar(1, "outro") is primeiro
+    carregar(2, "x")
+    assert chamadas == [1, 2]
+    assert cache.metricas()["bytes_por_funcao"] == {"carregar": 20}
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import proposta_custos
+
+
+@pytest.mark.parametrize(
+    "texto, esperado",
+    [
+        ("49", 49.0),
+        ("9.99", 9.99),
+        ("1,5", 1.5),
+        ("1.200,50", 1200.5),
+        ("1,234.56", 1234.56),
+        ("1,000", 1000.0),
+        ("1.000", 1000.0),
+        ("1.000.000", 1000000.0),
+        ("20.", 20.0),
+    ],
+)
+def test_numero(texto, esperado):
+    assert proposta_custos._numero(pd.Series([texto])).iloc[0] == pytest.approx(esperado)
+
+
+def test_numero_vazio_e_nan():
+    assert proposta_custos._numero(pd.Series([None, ""])).isna().all()
+
+
+def _custos(*textos, cobranca=None):
+    ferramentas = [{"Ferramenta": f"F{i}", "Custo": texto} for i, texto in enumerate(textos)]
+    if cobranca is not None:
+        for ferramenta, valor in zip(ferramentas, cobranca):
+            ferramenta["Cobrança"] = valor
+    return proposta_custos.tabela_custos(ferramentas)
+
+
+def test_tabela_custos_moeda_periodo_e_mensal():
+    custos = _custos("A partir de US$10/mês", "US$1,000/ano", "€30/quarter", "R$1.200,50 por year")
+    assert custos["moeda"].tolist() == ["USD", "USD", "EUR", "BRL"]
+    assert custos["periodo"].tolist() == [1, 12, 3, 12]
+    np.testing.assert_allclose(custos["mensal"], [10, 1000 / 12, 10, 1200.5 / 12])
+    assert custos["reconhecido"].all()
+
+
+def test_tabela_custos_marca_preco_e_periodo_nao_reconhecidos():
+    custos = _custos("Sob consulta", "US$5/user", "R$ 50", "Gratuito")
+    assert custos["reconhecido"].tolist() == [False, False, False, True]
+    assert np.isnan(custos["valor"].iloc[0])
+    assert np.isnan(custos["periodo"].iloc[1])
+    # Só gratuito, sem preço: custa zero por mês.
+    assert custos["mensal"].iloc[3] == 0
+
+
+def test_mensal_em_reais_com_cotacoes_e_gratuito():
+    custos = _custos("Gratuito / Plus: US$20/mês", "R$49/mês")
+    np.testing.assert_allclose(proposta_custos.mensal_em_reais(custos, {"USD": 5.0}), [100, 49])
+    np.testing.assert_allclose(proposta_custos.mensal_em_reais(custos, {"USD": 5.0}, usar_gratuito=True), [0, 49])
+
+
+def test_projetar_fixo_e_por_assento():
+    custos = _custos("R$100/mês", "R$10/mês", "Sob consulta", cobranca=["fixo", "assento", "fixo"])
+    assentos, mensal = proposta_custos.projetar(
+        custos, [2, 3], cenarios={"Metade": 0.5, "Dobro": 2.0}, assentos_extras=1
+    )
+    np.testing.assert_array_equal(assentos, [[2, 3], [5, 7]])
+    # O custo não reconhecido fica fora da projeção.
+    np.testing.assert_allclose(mensal, [[120, 130], [150, 170]])
+
+
+def test_equipe_por_empresa(tabelas):
+    empresas, tarefas = tabelas
+    np.testing.assert_array_equal(proposta_custos.equipe_por_empresa(empresas, tarefas), [2, 2])
+
+
+def test_resumo_projecao_tem_linha_de_total():
+    assentos = np.array([[1.0, 2.0]])
+    mensal = np.array([[10.0, 30.0]])
+    resumo = proposta_custos.resumo_projecao(["A", "B"], assentos, mensal, 4, cenarios={"Equipe": 1.0})
+    assert resumo.index[0] == "Total da proposta"
+    assert resumo.loc["Total da proposta", "Equipe · 4 meses (R$)"] == 160